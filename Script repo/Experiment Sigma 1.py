@@ -1,38 +1,43 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from qutip import *
+from urcm_operator_factory import OperatorFactory
+from urcm_lowrank import LowRankState, fidelity as lowrank_fidelity
 
 # Simulation parameters
 d = 50  # Hilbert space dimension
 cycles = 5  # Number of cosmological cycles
 noise_strengths = [0.0, 0.1]  # Noise-free and medium noise conditions
+seed = 0  # operator draws are keyed on (d, seed, cycle, kind) and shared by every noise run
+
+operators = OperatorFactory(d, seed)
+operators.prefetch("projector", range(cycles))
+operators.prefetch("hamiltonian", range(cycles))
 
 def generate_high_entropy_state(d):
-    """Generate a high-entropy mixed state as the initial state."""
+    """Generate a high-entropy mixed state as the initial state (held in factored form)."""
     psi_list = [rand_ket(d) for _ in range(20)]
-    rho = sum([ket2dm(psi) for psi in psi_list]) / 20
-    return rho.unit()
+    return LowRankState.from_kets(psi_list)
 
-def compression_operator(rho):
-    """Apply compression operator C: projects to a boundary subspace."""
-    proj = Qobj(np.random.rand(d, d)).unit()
-    return (proj * rho * proj.dag()).unit()
+def compression_operator(rho, cycle):
+    """Apply compression operator C: projects to a boundary subspace.
+    Kept lazy until the reset. At this d = 50 (<= urcm_lowrank.DENSE_MAX_DIM = 256) S still
+    builds the dense P rho P† and diagonalises it; only above 256 does it work off the factor."""
+    proj = operators.get("projector", cycle)  # overall scale cancels in the normalisation
+    return rho.compress(proj)
 
 def entropy_reset_operator(rho):
     """Apply entropy reset operator S: projects to the lowest-entropy eigenstate."""
-    eigvals, eigvecs = rho.eigenstates()
-    return (eigvecs[0] * eigvecs[0].dag()).unit()
+    return rho.reset(which="lowest")
 
-def bounce_operator(rho):
-    """Apply bounce operator B: unitary evolution with a random Hermitian Hamiltonian."""
-    H = rand_herm(d)
-    U = (-1j * H).expm()
-    return (U * rho * U.dag()).unit()
+def bounce_operator(rho, cycle):
+    """Apply bounce operator B: unitary evolution with a random Hermitian Hamiltonian.
+    Only the factor columns are evolved, via Krylov expm_multiply."""
+    return rho.bounce(operators.get("hamiltonian", cycle))
 
 def apply_noise(rho, strength):
     """Apply depolarizing noise to the state."""
-    identity = qeye(d)
-    return ((1 - strength) * rho + strength * (identity / d)).unit()
+    return rho.depolarize(strength)
 
 # Initialize results dictionary
 results = {}
@@ -45,16 +50,16 @@ for ε in noise_strengths:
     rho_initial = generate_high_entropy_state(d)
     rho_current = rho_initial
 
-    for _ in range(cycles):
+    for cycle in range(cycles):
         # Apply operator sequence: R = B ∘ S ∘ C
-        rho_next = bounce_operator(entropy_reset_operator(compression_operator(rho_current)))
+        rho_next = bounce_operator(entropy_reset_operator(compression_operator(rho_current, cycle)), cycle)
 
         # Optionally add noise
         rho_next = apply_noise(rho_next, ε)
 
         # Record von Neumann entropy and fidelity with initial state
-        entropy_vals.append(entropy_vn(rho_next))
-        memory_vals.append(fidelity(rho_initial, rho_next))
+        entropy_vals.append(rho_next.entropy())
+        memory_vals.append(lowrank_fidelity(rho_initial, rho_next))
 
         # Prepare for next cycle
         rho_current = rho_next
@@ -64,6 +69,8 @@ for ε in noise_strengths:
         'memory': memory_vals
     }
 
+operators.close()
+
 # Plotting
 cycles_range = np.arange(1, cycles + 1)
 colors = ['orange', 'orangered']
@@ -2,40 +2,36 @@
 import numpy as np
 import pandas as pd
 from qutip import *
+from urcm_lowrank import LowRankState, fidelity as lowrank_fidelity
 
 # Parameters
 d = 20  # Hilbert space dimension
 cycles = 3  # Number of cycles
 noise_strength = 0.05  # Strength of depolarizing noise
 
+# States are held in factored form p0 * I/d + V diag(w) V† (see urcm_lowrank)
+
 # Initial high-entropy state (random mixed state)
 def generate_high_entropy_state(d):
     psi_list = [rand_ket(d) for _ in range(20)]
-    rho = sum([ket2dm(psi) for psi in psi_list]) / 20
-    return rho
+    return LowRankState.from_kets(psi_list)
 
-# Compression operator: simulate projection to a boundary subspace
+# Compression operator: simulate projection to a boundary subspace (applied lazily)
 def compression_operator(rho):
-    proj = Qobj(np.random.rand(d, d))
-    proj = proj.unit()
-    return (proj * rho * proj.dag()).unit()
+    proj = np.random.rand(d, d)  # overall scale cancels in the normalisation
+    return rho.compress(proj)
 
 # Entropy reset operator: simulate purification to dominant eigenstate
 def entropy_reset_operator(rho):
-    eigvals, eigvecs = rho.eigenstates()
-    purified = eigvecs[0] * eigvecs[0].dag()
-    return purified.unit()
+    return rho.reset(which="lowest")  # eigvecs[0]: lowest eigenvalue, as before
 
-# Bounce operator: simulate with unitary evolution
+# Bounce operator: simulate with unitary evolution (Krylov on the factor columns)
 def bounce_operator(rho):
-    H = rand_herm(d)
-    U = (-1j * H).expm()
-    return (U * rho * U.dag()).unit()
+    return rho.bounce(rand_herm(d))
 
 # Noise model: apply depolarizing noise
 def apply_noise(rho, strength):
-    identity = qeye(d)
-    return (1 - strength) * rho + strength * (identity / d)
+    return rho.depolarize(strength)
 
 # Simulation loop with noise
 entropy_vals = []
@@ -51,11 +47,11 @@ for cycle in range(cycles):
     rho_next = bounce_operator(rho_noisy)
 
     # Record entropy
-    S = entropy_vn(rho_next)
+    S = rho_next.entropy()
     entropy_vals.append(S)
 
     # Record fidelity (memory overlap)
-    F = fidelity(rho_prev, rho_next)
+    F = lowrank_fidelity(rho_prev, rho_next)
     memory_vals.append(F)
 
     rho_prev = rho_current
@@ -8,6 +8,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.linalg import eigvalsh
+import urcm_pure_states as ps
 
 # ========================
 # PARAMETERS
@@ -22,64 +23,42 @@ recursions = 8
 # ========================
 # OPERATOR DEFINITIONS
 # ========================
+# Operators and metrics act on the (num_universes, dim) array of universe states
 
 # Projection operator: collapses a quantum state into the basis state
 # with maximum probability amplitude. This simulates measurement.
-def projection_operator(state):
-    projected = np.zeros_like(state)
-    idx = np.argmax(np.abs(state)**2)
-    projected[idx] = 1.0
-    return projected
+def projection_operator(states):
+    return ps.project_argmax(states)
 
 # Decoherence model: adds complex Gaussian noise to simulate entanglement loss
-def decohere(state, strength=0.2):
-    noise = np.random.normal(0, strength, state.shape) + 1j * np.random.normal(0, strength, state.shape)
-    decohered = state + noise
-    norm = np.linalg.norm(decohered)
-    return decohered / norm if norm != 0 else decohered
+def decohere(states, strength=0.2):
+    return ps.decohere(states, strength)
 
 # Purity metric: Tr(ρ^2), where ρ is the density matrix of the state
-def purity(state):
-    rho = np.outer(state, np.conj(state))
-    return np.real(np.trace(rho @ rho))
+def purity(states):
+    return ps.purity(states)
 
 # Participation Ratio: 1 / Σp_i^2, reflects how spread out the state amplitudes are
-def participation_ratio(state):
-    probs = np.abs(state)**2
-    return 1 / np.sum(probs**2)
+def participation_ratio(states):
+    return ps.participation_ratio(states)
 
 # ========================
 # SIMULATION FUNCTION
 # ========================
 # Evolves all universes through N recursive cycles with or without projection
 def run_simulation(apply_projection=True):
-    states = [np.random.rand(dim) + 1j*np.random.rand(dim) for _ in range(num_universes)]
-    states = [s / np.linalg.norm(s) for s in states]
+    states = ps.random_states(num_universes, dim)
 
     entropy_data, purity_data, pr_data = [], [], []
 
     for cycle in range(recursions):
-        new_states = []
+        states = decohere(states, strength=0.1 + 0.05 * cycle)
+        if apply_projection:
+            states = projection_operator(states)
 
-        for state in states:
-            state = decohere(state, strength=0.1 + 0.05 * cycle)
-            if apply_projection:
-                state = projection_operator(state)
-            new_states.append(state)
-
-        states = new_states
-
-        entropy_cycle, purity_cycle, pr_cycle = [], [], []
-        for state in states:
-            probs = np.abs(state)**2
-            probs = probs[probs > 0]
-            entropy_cycle.append(-np.sum(probs * np.log2(probs)))
-            purity_cycle.append(purity(state))
-            pr_cycle.append(participation_ratio(state))
-
-        entropy_data.append(entropy_cycle)
-        purity_data.append(purity_cycle)
-        pr_data.append(pr_cycle)
+        entropy_data.append(ps.entropy(states))
+        purity_data.append(purity(states))
+        pr_data.append(participation_ratio(states))
 
     return {
         "entropy": np.array(entropy_data),
@@ -6,6 +6,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+import urcm_pure_states as ps
 
 # ========================
 # PARAMETERS
@@ -20,22 +21,19 @@ recursions = 10
 # ========================
 # METRIC DEFINITIONS
 # ========================
+# Metrics and operators act on the (num_universes, dim) array of universe states
 
 # Entropy: quantifies randomness in the state
-def entropy(state):
-    probs = np.abs(state)**2
-    probs = probs[probs > 0]
-    return -np.sum(probs * np.log2(probs))
+def entropy(states):
+    return ps.entropy(states)
 
 # Participation Ratio: 1 / Σpᵢ², indicates state spread
-def participation_ratio(state):
-    probs = np.abs(state)**2
-    return 1.0 / np.sum(probs**2)
+def participation_ratio(states):
+    return ps.participation_ratio(states)
 
 # Purity: Tr(ρ²), checks closeness to pure eigenstates
-def purity(state):
-    rho = np.outer(state, np.conj(state))
-    return np.real(np.trace(rho @ rho))
+def purity(states):
+    return ps.purity(states)
 
 # ========================
 # OPERATOR DEFINITIONS
@@ -43,45 +41,34 @@ def purity(state):
 
 # Decoherence Model
 # Adds Gaussian noise scaled by cycle depth
-def decohere(state, strength):
-    noise = np.random.normal(0, strength, state.shape) + 1j*np.random.normal(0, strength, state.shape)
-    new_state = state + noise
-    return new_state / np.linalg.norm(new_state)
+def decohere(states, strength):
+    return ps.decohere(states, strength)
 
 # Bounce Operator 𝐵̂′
 # Resets the system at entropy minima to a basis-dominant low-entropy state
-def bounce_operator(state):
-    idx = np.argmax(np.abs(state)**2)
-    reset = np.zeros_like(state)
-    reset[idx] = 1.0
-    return reset
+def bounce_operator(states, where=None):
+    return ps.project_argmax(states, where)
 
 # ========================
 # SIMULATION FUNCTION
 # ========================
 # Evolves system with or without bounce operator 𝐵̂′
 def run_simulation(apply_bounce=True):
-    states = [np.random.rand(dim) + 1j*np.random.rand(dim) for _ in range(num_universes)]
-    states = [s / np.linalg.norm(s) for s in states]
+    states = ps.random_states(num_universes, dim)
 
     entropy_record, purity_record, pr_record = [], [], []
 
     for cycle in range(recursions):
-        new_states = []
-        for state in states:
-            strength = 0.1 + 0.05 * cycle
-            state = decohere(state, strength)
+        strength = 0.1 + 0.05 * cycle
+        states = decohere(states, strength)
 
-            # Apply bounce at entropy minima
-            if apply_bounce and entropy(state) < 2.0:
-                state = bounce_operator(state)
+        # Apply bounce at entropy minima
+        if apply_bounce:
+            states = bounce_operator(states, where=entropy(states) < 2.0)
 
-            new_states.append(state)
-
-        states = new_states
-        entropy_record.append(np.mean([entropy(s) for s in states]))
-        purity_record.append(np.mean([purity(s) for s in states]))
-        pr_record.append(np.mean([participation_ratio(s) for s in states]))
+        entropy_record.append(np.mean(entropy(states)))
+        purity_record.append(np.mean(purity(states)))
+        pr_record.append(np.mean(participation_ratio(states)))
 
     return entropy_record, purity_record, pr_record
 
@@ -3,39 +3,21 @@
 # Runs 1500 recursive simulations and evaluates 5 metrics for empirical detection from Planck/CMB-S4 residuals
 
 import numpy as np
-from scipy.ndimage import gaussian_filter1d
-from scipy.stats import skew
 import pandas as pd
+from urcm_cmb import CMBRealisations
 
 # Parameters
 n_multipoles = 2500
 n_cycles = 1500
+chunk_size = 10_000  # realisations per (chunk_size, n_multipoles) block
+scan_lags = None  # e.g. np.arange(1, 1000) to scan RAC over lag space for recursion echoes
 np.random.seed(42)
 
-# Simulated Planck baseline
-lcdm_base = np.exp(-np.linspace(0, 8, n_multipoles)) * np.sin(np.linspace(0, 20 * np.pi, n_multipoles))
-
-# Metric storage
-metrics = {'ΔCℓ²': [], 'Sₑ': [], 'PNRC': [], 'LℓSM': [], 'RAC': []}
-
-for _ in range(n_cycles):
-    echo = 0.03 * np.sin(np.linspace(0, 80 * np.pi, n_multipoles)) * np.exp(-np.linspace(0, 10, n_multipoles))
-    noise = np.random.normal(0, 0.02, n_multipoles)
-    sim = lcdm_base + echo + noise
-
-    sim_filtered = gaussian_filter1d(sim, sigma=5)
-    base_filtered = gaussian_filter1d(lcdm_base + np.random.normal(0, 0.05, n_multipoles), sigma=5)
-    residual = sim_filtered - base_filtered
-
-    metrics['ΔCℓ²'].append(np.mean(residual**2))
-    metrics['Sₑ'].append(skew(sim_filtered))
-    metrics['PNRC'].append(np.max(residual) / np.std(base_filtered))
-    low_l_sim = sim_filtered[2] + sim_filtered[3]
-    low_l_base = base_filtered[2] + base_filtered[3]
-    metrics['LℓSM'].append(abs((low_l_sim / low_l_base) - 1))
-    lag = 50
-    rac = np.dot(residual[:-lag], residual[lag:]) / np.dot(residual, residual) if lag < len(residual) else 0.0
-    metrics['RAC'].append(rac)
+# Simulated Planck baseline plus the recursion echo, filtered once; the
+# realisations and all five metrics are computed a block at a time
+realisations = CMBRealisations(n_multipoles, scan_lags=scan_lags)
+metrics = realisations.run(n_cycles, chunk_size)
+rac_scan = metrics.pop('RAC_scan', None)
 
 df_metrics = pd.DataFrame(metrics)
 
@@ -53,3 +35,8 @@ df_summary = pd.DataFrame({
 })
 
 print(df_summary)
+
+if rac_scan is not None:
+    mean_rac = rac_scan.mean(axis=0)
+    peak = np.argmax(np.abs(mean_rac))
+    print(f"Strongest mean RAC at lag {scan_lags[peak]}: {mean_rac[peak]:.4f}")
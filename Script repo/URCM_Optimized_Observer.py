@@ -1,7 +1,10 @@
+import argparse
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.fftpack import fft
 from scipy.stats import skew
+from urcm_checkpoint import Checkpoint
+from urcm_rolling import rolling_std
 
 # --- Core Modules ---
 
@@ -11,22 +14,53 @@ def cycle_entropy_slope(cycle):
 def expansion_dilution(Λ):
     return Λ * 0.001
 
-def recursive_universe_step(state, cycle, Λ_eff):
+# The state series is a dict of preallocated (T,) columns: 'entropy', 'Λ', 'cycle'
+# and the per-row 'density_std' / 'density_skew' of the (10, 10) density grid.
+# Row t holds the state after t cycles. The density history is not kept: grids are
+# buffered up to DENSITY_BLOCK_BYTES and their spread and skew recorded a block of
+# rows at a time, so memory grows with T, not with T x grid. With K universes the
+# density is (K, 10, 10), the non-cycle columns are (T, K), and every step evolves
+# all K at once.
+# The density spread is ~1e-4 of its mean, so storing the grid in float32 (opt-in
+# via density_dtype / --float32) is lossy: measured against float64 over 25k cycles
+# it shifts density_skew by ~1% (far more where the skew is near zero) and
+# cmb_low_l by up to ~3.4%. float64 reproduces the per-cycle float64 results exactly.
+DENSITY_DTYPE = np.float64
+DENSITY_BLOCK_BYTES = 1 << 26
+
+def allocate_series(T, universes=None):
+    K = () if universes is None else (universes,)
+    return {
+        'entropy': np.empty((T,) + K),
+        'Λ': np.empty((T,) + K),
+        'density_std': np.empty((T,) + K),
+        'density_skew': np.empty((T,) + K),
+        'cycle': np.empty(T, dtype=np.int64)
+    }
+
+def record_density(series, row, densities):
+    # Spread and skew of every grid in a block of density rows starting at `row`, in float64
+    grids = np.asarray(densities, dtype=np.float64)
+    grids = grids.reshape(grids.shape[:-2] + (-1,))
+    series['density_std'][row:row + len(grids)] = np.std(grids, axis=-1)
+    series['density_skew'][row:row + len(grids)] = skew(grids, axis=-1)
+
+def recursive_universe_step(series, density, cycle, Λ_eff):
+    # Advance row `cycle` of the series into row `cycle + 1` in place and return the
+    # new density (its spread and skew are left to record_density)
     entropy_slope = cycle_entropy_slope(cycle)
     dark_energy_mod = Λ_eff * (1 + 0.01 * np.sin(cycle / 10))
-    matter_growth = dark_matter_growth(state['density'], entropy_slope)
+    matter_growth = dark_matter_growth(density, entropy_slope)
 
-    new_density = state['density'] + matter_growth - expansion_dilution(dark_energy_mod)
-    new_entropy = state['entropy'] + entropy_slope
-
-    return {
-        'density': new_density,
-        'entropy': new_entropy,
-        'Λ': dark_energy_mod,
-        'cycle': cycle + 1
-    }
+    dilution = np.asarray(expansion_dilution(dark_energy_mod))[..., None, None]  # per universe
+    density = (density + matter_growth - dilution).astype(density.dtype, copy=False)
+    series['entropy'][cycle + 1] = series['entropy'][cycle] + entropy_slope
+    series['Λ'][cycle + 1] = dark_energy_mod
+    series['cycle'][cycle + 1] = cycle + 1
+    return density
 
 def dark_matter_growth(density, entropy_gradient):
+    # One draw covers every universe's grid
     fluctuation = np.random.normal(0, 0.01, size=density.shape)
     growth = 0.05 * np.tanh(entropy_gradient) * (1 + fluctuation)
     return density * growth
@@ -36,34 +70,36 @@ def predict_clock_drift(cycles, base_drift=1e-18):
 
 # --- Optimized Metrics ---
 
-def extract_metrics(state_series):
-    entropy_series = [s['entropy'] for s in state_series]
-    Λ_series = [s['Λ'] for s in state_series]
-    density_series = [s['density'] for s in state_series]
-    clock_drift = predict_clock_drift(np.arange(len(state_series)))
+def extract_metrics(series):
+    # Works on (T, K) columns throughout; a single-universe series is K = 1 and
+    # gets the original single-universe record back
+    batched = series['entropy'].ndim == 2
+    entropy_series, Λ_series, cmb_variance, density_skew = (
+        series[key] if batched else series[key][:, None] for key in ('entropy', 'Λ', 'density_std', 'density_skew'))
+    T, K = entropy_series.shape
+    clock_drift = predict_clock_drift(np.arange(T))
 
     # 1. Clock Drift Spectrum
     clock_drift_fft = np.abs(fft(clock_drift - np.mean(clock_drift)))
     clock_freqs = np.fft.fftfreq(len(clock_drift))
 
     # 2. CMB Low-ℓ Envelope
-    cmb_variance = [np.std(s['density']) for s in state_series]
     window = 500
-    cmb_low_l = np.array([np.std(cmb_variance[i:i+window]) for i in range(len(cmb_variance)-window)])
+    cmb_low_l = rolling_std(cmb_variance, window)[:T - window]  # O(n); omits the final window as before
 
-    # 3. Lensing Gradient Distortion (Skew)
-    density_skew = [skew(s['density'].flatten()) for s in state_series]
+    # 3. Lensing Gradient Distortion (Skew): density_skew is recorded row by row while stepping
 
     # 4. Λ(t) Drift Reversals
-    Λ_diff = np.diff(Λ_series)
-    Λ_reversals = np.where(np.diff(np.sign(Λ_diff)) != 0)[0]
+    Λ_diff = np.diff(Λ_series, axis=0)
+    Λ_reversals = [np.where(np.diff(np.sign(Λ_diff[:, k])) != 0)[0] for k in range(K)]
 
     # 5. Entropy Collapse + Λ Spike Coincidence
-    entropy_minima = np.where(np.array(entropy_series) < np.percentile(entropy_series, 2))[0]
-    Λ_peaks = np.where(np.array(Λ_series) > np.percentile(Λ_series, 98))[0]
-    coincidence_events = np.intersect1d(entropy_minima, Λ_peaks)
+    entropy_minima = entropy_series < np.percentile(entropy_series, 2, axis=0)
+    Λ_peaks = Λ_series > np.percentile(Λ_series, 98, axis=0)
+    coincident = entropy_minima & Λ_peaks
+    coincidence_events = [np.flatnonzero(coincident[:, k]) for k in range(K)]
 
-    return {
+    metrics = {
         'entropy': entropy_series,
         'Λ_trace': Λ_series,
         'cmb_low_l': cmb_low_l,
@@ -73,16 +109,75 @@ def extract_metrics(state_series):
         'Λ_reversals': Λ_reversals,
         'coincidence_events': coincidence_events
     }
+    if not batched:
+        return {key: value[0] if isinstance(value, list) else (value[:, 0] if value.ndim == 2 else value)
+                for key, value in metrics.items()}
+
+    # Ensemble view: events per universe, universes coinciding at each cycle,
+    # and the fraction of universes with at least one coincidence
+    counts = coincident.sum(axis=0)
+    metrics['coincidence_counts'] = counts
+    metrics['ensemble_coincidences'] = coincident.sum(axis=1)
+    metrics['coincidence_rate'] = np.mean(counts > 0)
+    return metrics
 
 # --- Simulation Driver ---
 
-def run_simulation(cycles=25000):
-    state_series = [{
-        'density': np.ones((10, 10)) * 0.5,
-        'entropy': 0.0,
-        'Λ': 0.7,
-        'cycle': 0
-    }]
-    for i in range(cycles):
-        state_series.append(recursive_universe_step(state_series[-1], i, state_series[-1]['Λ']))
-    return extract_metrics(state_series)
+def run_simulation(cycles=25000, checkpoint_path=None, checkpoint_every=5000, resume=False, universes=None,
+                   density_dtype=None):
+    # With checkpoint_path set, np.random and the series rows added since the last
+    # save are written every checkpoint_every cycles; resume=True continues
+    # bit-exactly from the last save.
+    # universes=K evolves K independent universes together (batched metrics)
+    if resume and not checkpoint_path:
+        raise ValueError("resume=True needs a checkpoint_path")
+    series = allocate_series(cycles + 1, universes=universes)
+    checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
+    if resume:
+        start, arrays, saved, _ = checkpoint.load()
+        density = arrays['density']
+        for key, column in saved.items():
+            series[key][:start + 1] = column
+        pending = []  # densities of rows first, first + 1, ... not yet recorded
+    else:
+        start = 0
+        density = np.full(((universes,) if universes else ()) + (10, 10), 0.5, dtype=density_dtype or DENSITY_DTYPE)
+        series['entropy'][0] = 0.0
+        series['Λ'][0] = 0.7
+        series['cycle'][0] = 0
+        pending = [density]
+    first = start + 1 - len(pending)
+    block = max(1, DENSITY_BLOCK_BYTES // density.nbytes)
+    saved_rows = start + 1 if resume else 0
+    for i in range(start, cycles):
+        density = recursive_universe_step(series, density, i, series['Λ'][i])
+        pending.append(density)
+        save = checkpoint and (i + 1) % checkpoint_every == 0
+        if save or len(pending) == block:
+            record_density(series, first, pending)
+            pending, first = [], i + 2
+        if save:
+            checkpoint.save(i + 1, {'density': density},
+                            rows={key: column[saved_rows:i + 2] for key, column in series.items()})
+            saved_rows = i + 2
+    if pending:
+        record_density(series, first, pending)
+    return extract_metrics(series)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cycles", type=int, default=25000)
+    parser.add_argument("--checkpoint", help="save progress to this .npz every 5000 cycles")
+    parser.add_argument("--resume", action="store_true", help="continue from --checkpoint")
+    parser.add_argument("--universes", type=int, default=None, help="evolve this many universes together")
+    parser.add_argument("--float32", action="store_true", help="hold the density grid in float32 (lossy)")
+    args = parser.parse_args()
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint")
+    metrics = run_simulation(args.cycles, args.checkpoint, resume=args.resume, universes=args.universes,
+                             density_dtype=np.float32 if args.float32 else None)
+    if args.universes is None:
+        print(f"{len(metrics['coincidence_events'])} entropy-collapse / Λ-spike coincidences")
+    else:
+        print(f"{metrics['coincidence_rate']:.1%} of {args.universes} universes show entropy-collapse / Λ-spike "
+              f"coincidences ({metrics['coincidence_counts'].mean():.2f} per universe)")
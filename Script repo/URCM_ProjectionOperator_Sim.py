@@ -4,6 +4,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+import urcm_metrics
 
 # Parameters
 num_universes = 5
@@ -26,19 +27,16 @@ def decohere(state, strength):
 
 # Metric: Entropy
 def entropy(state):
-    probs = np.abs(state)**2
-    probs = probs[probs > 0]
-    return -np.sum(probs * np.log2(probs))
+    return urcm_metrics.basis_entropy(state)
 
 # Metric: Participation Ratio
 def participation_ratio(state):
-    probs = np.abs(state)**2
-    return 1.0 / np.sum(probs**2)
+    return urcm_metrics.participation_ratio(state)
 
 # Metric: Purity (Tr(ρ²) for pure state vector)
 def purity(state):
-    rho = np.outer(state, np.conj(state))
-    return np.real(np.trace(rho @ rho))
+    # ||psi||^4 from |psi|^2, no d x d outer product
+    return urcm_metrics.purity(state)
 
 # Run simulation
 def run_simulation(use_projection=True):
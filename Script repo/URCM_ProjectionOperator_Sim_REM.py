@@ -6,6 +6,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+import urcm_metrics
 
 # ========================
 # PARAMETERS
@@ -40,21 +41,18 @@ def decohere(state, strength):
 # Entropy Metric
 # Computes Shannon entropy of the quantum state's probability distribution
 def entropy(state):
-    probs = np.abs(state)**2
-    probs = probs[probs > 0]
-    return -np.sum(probs * np.log2(probs))
+    return urcm_metrics.basis_entropy(state)
 
 # Participation Ratio Metric
 # Measures the effective spread of probability across basis states
 def participation_ratio(state):
-    probs = np.abs(state)**2
-    return 1.0 / np.sum(probs**2)
+    return urcm_metrics.participation_ratio(state)
 
 # Purity Metric
 # Computes Tr(ρ²) where ρ = |ψ⟩⟨ψ|, should be 1 for pure states
 def purity(state):
-    rho = np.outer(state, np.conj(state))
-    return np.real(np.trace(rho @ rho))
+    # ||psi||^4 from |psi|^2, no d x d outer product
+    return urcm_metrics.purity(state)
 
 # ========================
 # SIMULATION FUNCTION
@@ -4,65 +4,48 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+import urcm_pure_states as ps
 
 # Parameters
 num_universes = 5
 dim = 10
 recursions = 10
 
-def bounce_operator(state):
+# All operators act on the (num_universes, dim) array of universe states
+
+def bounce_operator(states):
     # Simulated bounce at entropy minima - rescale state to start anew
-    idx = np.argmax(np.abs(state)**2)
-    reset = np.zeros_like(state)
-    reset[idx] = 1.0
-    return reset
+    return ps.project_argmax(states)
 
-def temporal_modulation(state, cycle):
+def temporal_modulation(states, cycle):
     # Apply entropy slope logic through noise scaled by cycle depth
     noise_strength = 0.05 + 0.02 * cycle
-    noise = np.random.normal(0, noise_strength, state.shape) + 1j * np.random.normal(0, noise_strength, state.shape)
-    modulated = state + noise
-    norm = np.linalg.norm(modulated)
-    return modulated / norm if norm != 0 else modulated
+    return ps.decohere(states, noise_strength)
 
-def fix_operator(state):
+def fix_operator(states):
     # Normalize state to preserve trace = 1
-    return state / np.linalg.norm(state)
-
-def recursive_R_operator(state, cycle):
-    state = fix_operator(state)
-    state = temporal_modulation(state, cycle)
-    state = bounce_operator(state)
-    return state
-
-def participation_ratio(state):
-    probs = np.abs(state)**2
-    return 1 / np.sum(probs**2)
+    return ps.normalise(states)
 
-def entropy(state):
-    probs = np.abs(state)**2
-    probs = probs[probs > 0]
-    return -np.sum(probs * np.log2(probs))
+def recursive_R_operator(states, cycle):
+    states = fix_operator(states)
+    states = temporal_modulation(states, cycle)
+    states = bounce_operator(states)
+    return states
 
 def run_simulation(use_recursive_operator=True):
-    states = [np.random.rand(dim) + 1j*np.random.rand(dim) for _ in range(num_universes)]
-    states = [s / np.linalg.norm(s) for s in states]
+    states = ps.random_states(num_universes, dim)
 
     entropies = []
     prs = []
 
     for cycle in range(recursions):
-        new_states = []
-        for state in states:
-            if use_recursive_operator:
-                updated = recursive_R_operator(state, cycle)
-            else:
-                updated = temporal_modulation(state, cycle)  # No bounce/fix logic
-            new_states.append(updated)
+        if use_recursive_operator:
+            states = recursive_R_operator(states, cycle)
+        else:
+            states = temporal_modulation(states, cycle)  # No bounce/fix logic
 
-        states = new_states
-        entropies.append(np.mean([entropy(s) for s in states]))
-        prs.append(np.mean([participation_ratio(s) for s in states]))
+        entropies.append(np.mean(ps.entropy(states)))
+        prs.append(np.mean(ps.participation_ratio(states)))
 
     return entropies, prs
 
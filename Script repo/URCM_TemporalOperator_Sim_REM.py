@@ -6,6 +6,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+import urcm_pure_states as ps
 
 # ========================
 # PARAMETERS
@@ -20,59 +21,49 @@ recursions = 10
 # ========================
 # METRIC DEFINITIONS
 # ========================
+# Metrics and operators act on the (num_universes, dim) array of universe states
 
 # Entropy: Shannon entropy of state's probability distribution
-def entropy(state):
-    probs = np.abs(state)**2
-    probs = probs[probs > 0]
-    return -np.sum(probs * np.log2(probs))
+def entropy(states):
+    return ps.entropy(states)
 
 # Entropy Slope: Change in entropy over cycles (ΔS)
 def entropy_slope(entropy_series):
     return np.gradient(entropy_series)
 
 # Participation Ratio: Inverse of probability concentration
-def participation_ratio(state):
-    probs = np.abs(state)**2
-    return 1.0 / np.sum(probs**2)
+def participation_ratio(states):
+    return ps.participation_ratio(states)
 
 # Purity: Tr(ρ²) for a pure state vector
-def purity(state):
-    rho = np.outer(state, np.conj(state))
-    return np.real(np.trace(rho @ rho))
+def purity(states):
+    return ps.purity(states)
 
 # ========================
 # TEMPORAL MODULATION
 # ========================
 
 # Simulated effect of 𝑇̂ᵐ′: Adds decoherence noise growing with cycle index
-def apply_temporal_modulation(state, cycle):
+def apply_temporal_modulation(states, cycle):
     strength = 0.05 + 0.05 * cycle
-    noise = np.random.normal(0, strength, state.shape) + 1j*np.random.normal(0, strength, state.shape)
-    modulated = state + noise
-    return modulated / np.linalg.norm(modulated)
+    return ps.decohere(states, strength)
 
 # ========================
 # SIMULATION FUNCTION
 # ========================
 # Evolves systems with or without temporal modulation operator 𝑇̂ᵐ′
 def run_temporal_simulation(use_temporal_operator=True):
-    states = [np.random.rand(dim) + 1j*np.random.rand(dim) for _ in range(num_universes)]
-    states = [s / np.linalg.norm(s) for s in states]
+    states = ps.random_states(num_universes, dim)
 
     entropy_values, purity_values, pr_values = [], [], []
 
     for cycle in range(recursions):
-        new_states = []
-        for state in states:
-            if use_temporal_operator:
-                state = apply_temporal_modulation(state, cycle)
-            new_states.append(state)
-
-        states = new_states
-        entropy_values.append(np.mean([entropy(s) for s in states]))
-        purity_values.append(np.mean([purity(s) for s in states]))
-        pr_values.append(np.mean([participation_ratio(s) for s in states]))
+        if use_temporal_operator:
+            states = apply_temporal_modulation(states, cycle)
+
+        entropy_values.append(np.mean(entropy(states)))
+        purity_values.append(np.mean(purity(states)))
+        pr_values.append(np.mean(participation_ratio(states)))
 
     return np.array(entropy_values), np.array(purity_values), np.array(pr_values), entropy_slope(entropy_values)
 
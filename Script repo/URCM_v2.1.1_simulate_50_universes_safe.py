@@ -2,6 +2,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import os
+from urcm_entropy_kernel import von_neumann_entropy as kernel_entropy
 
 # Parameters
 num_universes = 50
@@ -16,9 +17,7 @@ def generate_initial_state():
 
 def von_neumann_entropy(rho):
     try:
-        eigvals = np.linalg.eigvalsh(rho)
-        eigvals = eigvals[eigvals > 0]  # avoid log(0)
-        return -np.sum(eigvals * np.log(eigvals))
+        return kernel_entropy(rho)
     except Exception as e:
         print("Error in entropy calculation:", e)
         return np.nan
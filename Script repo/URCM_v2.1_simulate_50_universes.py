@@ -1,6 +1,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from urcm_entropy_kernel import von_neumann_entropy
 
 # Parameters
 num_universes = 50
@@ -13,11 +14,6 @@ max_timesteps = 5000  # fail-safe limit
 def generate_initial_state():
     return np.eye(2) / 2  # maximally mixed state
 
-def von_neumann_entropy(rho):
-    eigvals = np.linalg.eigvalsh(rho)
-    eigvals = eigvals[eigvals > 0]
-    return -np.sum(eigvals * np.log(eigvals))
-
 def unitary_evolve(rho):
     theta = np.random.rand() * 2 * np.pi
     U = np.array([[np.cos(theta), -np.sin(theta)],
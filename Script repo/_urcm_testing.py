@@ -0,0 +1,34 @@
+import numpy as np
+import scipy.linalg
+
+# Reference helpers shared by the test_urcm_*.py files: random states drawn the
+# same way in every test, and the scripts' original dense eigvalsh / sqrtm
+# forms the structured kernels are checked against. Not a pytest conftest, so
+# the tests import these by name.
+
+def random_factor(d, k, rng):
+    """Complex Gaussian d x k matrix."""
+    return rng.normal(size=(d, k)) + 1j * rng.normal(size=(d, k))
+
+def random_state(d, rng, rank=None, complex_=True):
+    """Density matrix A A† / Tr for a Gaussian d x rank matrix A (full rank by default, real if not complex_)."""
+    k = d if rank is None else rank
+    A = random_factor(d, k, rng) if complex_ else rng.normal(size=(d, k))
+    rho = A @ A.conj().T
+    return rho / np.trace(rho).real
+
+def eigh_entropy(rho, cutoff=0.0):
+    """The scripts' original eigvalsh entropy, dropping eigenvalues <= cutoff."""
+    vals = np.linalg.eigvalsh(rho)
+    vals = vals[vals > cutoff]
+    return -np.sum(vals * np.log(vals))
+
+def sqrtm_fidelity(rho1, rho2, squared=False):
+    """Tr sqrt(sqrt(rho1) rho2 sqrt(rho1)) from two sqrtm calls.
+
+    squared=False is the qutip.fidelity convention; squared=True is the scripts'
+    original fidelity, the square of it.
+    """
+    s = scipy.linalg.sqrtm(rho1)
+    F = np.real(np.trace(scipy.linalg.sqrtm(s @ rho2 @ s)))
+    return F ** 2 if squared else F
@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from urcm_entropy_kernel import below_threshold
 
 num_universes = 50
 max_timesteps = 500
@@ -18,18 +19,12 @@ def apply_noise(rho, gamma=0.0):
     return rho
 
 
-def entropy(rho):
-    vals = np.linalg.eigvalsh(rho)
-    vals = vals[vals > 0]
-    return -np.sum(vals * np.log(vals))
-
 def simulate_universe():
     rho = np.eye(2) / 2
     for t in range(max_timesteps):
         if use_noise:
             rho = apply_noise(rho, gamma)
-        ent = entropy(rho)
-        if ent < entropy_threshold:
+        if below_threshold(rho, entropy_threshold):
             return t
     return None
 
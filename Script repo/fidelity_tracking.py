@@ -1,7 +1,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.linalg
+from urcm_fidelity import FixedReferenceFidelity
 
 # Parameters
 cycles = 20
@@ -13,11 +13,6 @@ def generate_initial_state(d):
     rho = sum(np.outer(psi, psi.conj()) for psi in psi_list) / len(psi_list)
     return rho / np.trace(rho)
 
-def fidelity(rho1, rho2):
-    sqrt_rho1 = scipy.linalg.sqrtm(rho1)
-    inner = scipy.linalg.sqrtm(sqrt_rho1 @ rho2 @ sqrt_rho1)
-    return np.real(np.trace(inner))**2
-
 def apply_random_noise(rho, noise_level=0.05):
     noise = noise_level * (np.random.randn(*rho.shape) + 1j*np.random.randn(*rho.shape))
     noise = (noise + noise.conj().T) / 2
@@ -28,11 +23,12 @@ def apply_random_noise(rho, noise_level=0.05):
 
 rho0 = generate_initial_state(d)
 rho = rho0.copy()
+fidelity_to_initial = FixedReferenceFidelity(rho0)  # sqrt(rho0) computed once
 fidelities = [1.0]
 
 for i in range(1, cycles + 1):
     rho = apply_random_noise(rho)
-    fidelities.append(fidelity(rho0, rho))
+    fidelities.append(fidelity_to_initial(rho))
 
 plt.figure(figsize=(10, 5))
 plt.plot(fidelities, marker='o')
@@ -1,6 +1,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from urcm_entropy_kernel import von_neumann_entropy
 
 # Parameters
 num_universes = 50
@@ -9,15 +10,11 @@ reset_prob = 0.02
 batch_size = 50
 entropy_threshold = 1e-3
 max_timesteps = 5000  # fail-safe limit
+use_bloch = False  # True: 3-float Bloch vectors per subsystem (urcm_bloch)
 
 def generate_initial_state():
     return np.eye(2) / 2  # maximally mixed state
 
-def von_neumann_entropy(rho):
-    eigvals = np.linalg.eigvalsh(rho)
-    eigvals = eigvals[eigvals > 0]
-    return -np.sum(eigvals * np.log(eigvals))
-
 def unitary_evolve(rho):
     theta = np.random.rand() * 2 * np.pi
     U = np.array([[np.cos(theta), -np.sin(theta)],
@@ -27,6 +24,10 @@ def unitary_evolve(rho):
 def entropy_reset(rho):
     return np.array([[1, 0], [0, 0]])
 
+if use_bloch:
+    # Matching names and np.random draws, so bounce times are unchanged
+    from urcm_bloch import generate_initial_state, von_neumann_entropy, unitary_evolve, entropy_reset
+
 def run_universe():
     states = [generate_initial_state() for _ in range(num_subsystems)]
     entropies = []
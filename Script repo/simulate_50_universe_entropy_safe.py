@@ -2,6 +2,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import os
+from urcm_ragged import save_traces
+from urcm_entropy_kernel import von_neumann_entropy as kernel_entropy
+import urcm_bloch
 
 # Parameters
 num_universes = 50
@@ -10,21 +13,24 @@ reset_prob = 0.02
 batch_size = 50
 entropy_threshold = 1e-3
 max_timesteps = 5000  # fail-safe limit
+use_bloch = False  # True: subsystems held as urcm_bloch vectors
 
 def generate_initial_state():
+    if use_bloch:
+        return urcm_bloch.generate_initial_state()
     return np.eye(2) / 2  # maximally mixed state
 
 def von_neumann_entropy(rho):
     try:
-        eigvals = np.linalg.eigvalsh(rho)
-        eigvals = eigvals[eigvals > 0]  # avoid log(0)
-        return -np.sum(eigvals * np.log(eigvals))
+        return urcm_bloch.von_neumann_entropy(rho) if use_bloch else kernel_entropy(rho)
     except Exception as e:
         print("Error in entropy calculation:", e)
         return np.nan
 
 def unitary_evolve(rho):
     try:
+        if use_bloch:
+            return urcm_bloch.unitary_evolve(rho)
         theta = np.random.rand() * 2 * np.pi
         U = np.array([[np.cos(theta), -np.sin(theta)],
                       [np.sin(theta), np.cos(theta)]])
@@ -34,6 +40,8 @@ def unitary_evolve(rho):
         return rho
 
 def entropy_reset(rho):
+    if use_bloch:
+        return urcm_bloch.entropy_reset(rho)
     return np.array([[1, 0], [0, 0]])
 
 def run_universe():
@@ -73,6 +81,13 @@ def safe_save(filename, data):
     except Exception as e:
         print(f"Failed to save {filename}: {e}")
 
+def safe_save_traces(filename, traces):
+    try:
+        stem = save_traces(filename, traces)
+        print(f"Saved: {stem}.values.npy, {stem}.offsets.npy")
+    except Exception as e:
+        print(f"Failed to save {filename}: {e}")
+
 def safe_plot(plot_func, filename):
     try:
         plot_func()
@@ -111,5 +126,5 @@ if __name__ == "__main__":
 
     safe_plot(plot_entropy_overlay, "overlay_entropy_50_universes_safe.png")
     safe_plot(plot_histogram, "bounce_histogram_50_universes_safe.png")
-    safe_save("all_entropy_traces_50_safe.npy", np.array(all_entropies, dtype=object))
+    safe_save_traces("all_entropy_traces_50_safe", all_entropies)
     safe_save("bounce_times_50_safe.npy", np.array(bounce_times))
@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt
 num_subsystems = 100
 timesteps = 200
 entropy_threshold = 1e-3
+use_bloch = False  # True: subsystems as 3-float Bloch vectors (urcm_bloch)
 
 # Initialize pure states with zero entropy
 def generate_initial_state():
@@ -25,6 +26,10 @@ def unitary_evolve(rho):
 def entropy_reset(rho):
     return np.array([[1, 0], [0, 0]])  # pure state |0><0|
 
+if use_bloch:
+    # Same names and random draws as the matrix versions above
+    from urcm_bloch import generate_initial_state, von_neumann_entropy, unitary_evolve, entropy_reset
+
 # Simulate
 states = [generate_initial_state() for _ in range(num_subsystems)]
 entropies = []
@@ -7,6 +7,7 @@ num_subsystems = 100
 reset_prob = 0.02
 batch_size = 50
 entropy_threshold = 1e-3
+use_bloch = False  # Bloch-vector qubits instead of 2x2 density matrices
 
 # Initialize mixed state (max entropy)
 def generate_initial_state():
@@ -26,6 +27,10 @@ def unitary_evolve(rho):
 def entropy_reset(rho):
     return np.array([[1, 0], [0, 0]])  # pure state |0><0|
 
+if use_bloch:
+    # Drop-in replacements; a seeded run bounces at the same timestep
+    from urcm_bloch import generate_initial_state, von_neumann_entropy, unitary_evolve, entropy_reset
+
 def run_simulation():
     states = [generate_initial_state() for _ in range(num_subsystems)]
     entropies = []
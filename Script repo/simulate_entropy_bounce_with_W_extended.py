@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 num_subsystems = 100
 entropy_threshold = 1e-3
 w_strength = 0.05  # strength of speculative W influence
+use_bloch = False  # True: run the subsystems as urcm_bloch vectors
 
 def generate_initial_state():
     return np.eye(2) / 2
@@ -26,6 +27,10 @@ def entropy_reset(rho):
 def apply_W_operator(rho, avg_state):
     return 0.95 * rho + 0.05 * avg_state
 
+if use_bloch:
+    # apply_W_operator is affine and works on the Bloch vectors as-is
+    from urcm_bloch import generate_initial_state, von_neumann_entropy, unitary_evolve, entropy_reset
+
 states = [generate_initial_state() for _ in range(num_subsystems)]
 entropies = []
 
@@ -2,10 +2,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import os
+from urcm_ragged import VALUES_SUFFIX, load_traces
 
 def load_data(file_path):
     if file_path.endswith('.csv'):
         return np.loadtxt(file_path, delimiter=',')
+    elif file_path.endswith(VALUES_SUFFIX):
+        return load_traces(file_path).values
     elif file_path.endswith('.npy'):
         return np.load(file_path)
     else:
@@ -37,7 +40,8 @@ def main():
         "Fidelity Decay": "fidelity_decay_output.npy",
         "Dispersion Heatmap": "fidelity_dispersion_heatmap_output.npy",
         "Recursive Stabilization": "recursive_stabilization_output.npy",
-        "Directional Entropy Flow": "directional_entropy_flow_output.npy"
+        "Directional Entropy Flow": "directional_entropy_flow_output.npy",
+        "Entropy Traces (500 Universes)": "all_entropy_traces_500" + VALUES_SUFFIX
     }
 
     for label, file_path in output_files.items():
@@ -1,48 +1,68 @@
-
 import numpy as np
 import matplotlib.pyplot as plt
-import scipy.linalg
+from urcm_fidelity import FixedReferenceFidelity
+
+# Batched subsystem dispersion: all subsystems evolve together as an (S, 2, 2)
+# complex tensor, each cycle's fidelity row is one stacked call, and rows are
+# streamed to a .npy memmap so memory stays bounded for S ~ 10^6, cycles ~ 10^4.
+# The heatmap is drawn from a bin-averaged view kept while streaming.
 
 subsystems = 25
 cycles = 20
 noise_level = 0.05
+output_file = "subsystem_fidelity_matrix.npy"
+max_plot_subsystems = 1000  # subsystem bins in the heatmap
+max_plot_cycles = 1000      # cycle rows in the heatmap
+
+def generate_initial_subsystems(subsystems, rng=None):
+    # Same draws as one randn(2) + 1j*randn(2) per subsystem
+    rng = np.random if rng is None else rng
+    z = rng.standard_normal((subsystems, 2, 2))
+    psi = z[:, 0] + 1j * z[:, 1]
+    psi /= np.linalg.norm(psi, axis=1, keepdims=True)
+    return psi[:, :, None] * psi[:, None, :].conj()
+
+def noisy_evolve(rhos, noise_level, rng=None):
+    # Hermitian complex noise on every subsystem at once (draw order matches the per-subsystem loop)
+    rng = np.random if rng is None else rng
+    z = rng.standard_normal((len(rhos), 2, 2, 2))
+    noise = noise_level * (z[:, 0] + 1j * z[:, 1])
+    rhos = rhos + (noise + noise.conj().swapaxes(-1, -2)) / 2
+    rhos = (rhos + rhos.conj().swapaxes(-1, -2)) / 2
+    return rhos / np.trace(rhos, axis1=-2, axis2=-1)[:, None, None]
+
+def bin_means(row, bins):
+    # Mean over contiguous subsystem bins; bin b is row[floor(b*S/bins):floor((b+1)*S/bins)],
+    # so bin sizes differ by at most one when S is not a multiple of bins
+    edges = np.linspace(0, len(row), bins + 1).astype(int)
+    return np.add.reduceat(row, edges[:-1]) / np.diff(edges)
+
+def run_dispersion(subsystems, cycles, noise_level, output_file, plot_bins=max_plot_subsystems, rng=None):
+    """Stream the (cycles + 1, S) fidelity matrix to output_file; return it memmapped plus a binned view."""
+    states = generate_initial_subsystems(subsystems, rng)
+    fidelity_to_initial = FixedReferenceFidelity(states)  # qubit closed form over the stack
+    plot_bins = min(plot_bins, subsystems)
+
+    fidelity_matrix = np.lib.format.open_memmap(output_file, mode="w+", dtype=np.float32, shape=(cycles + 1, subsystems))
+    binned = np.zeros((cycles + 1, plot_bins))
+    for i in range(cycles + 1):
+        row = fidelity_to_initial(states)
+        fidelity_matrix[i] = row
+        binned[i] = bin_means(row, plot_bins)
+        states = noisy_evolve(states, noise_level, rng)
+    fidelity_matrix.flush()
+    return fidelity_matrix, binned
+
+if __name__ == "__main__":
+    fidelity_matrix, binned = run_dispersion(subsystems, cycles, noise_level, output_file)
+    step = max(1, len(binned) // max_plot_cycles)
 
-def generate_initial_subsystems(subsystems):
-    rho_list = []
-    for _ in range(subsystems):
-        psi = np.random.randn(2) + 1j*np.random.randn(2)
-        psi /= np.linalg.norm(psi)
-        rho = np.outer(psi, psi.conj())
-        rho_list.append(rho)
-    return rho_list
-
-def fidelity_simple(rho1, rho2):
-    sqrt_rho1 = scipy.linalg.sqrtm(rho1)
-    inner = scipy.linalg.sqrtm(sqrt_rho1 @ rho2 @ sqrt_rho1)
-    return np.real(np.trace(inner))**2
-
-def noisy_evolve(rho, noise_level):
-    noise = noise_level * (np.random.randn(*rho.shape) + 1j*np.random.randn(*rho.shape))
-    noise = (noise + noise.conj().T) / 2
-    rho += noise
-    rho = (rho + rho.conj().T) / 2
-    rho /= np.trace(rho)
-    return rho
-
-initial_states = generate_initial_subsystems(subsystems)
-current_states = [rho.copy() for rho in initial_states]
-fidelity_matrix = np.zeros((cycles + 1, subsystems))
-
-for i in range(cycles + 1):
-    for j in range(subsystems):
-        fidelity_matrix[i, j] = fidelity_simple(initial_states[j], current_states[j])
-        current_states[j] = noisy_evolve(current_states[j], noise_level)
-
-plt.figure(figsize=(12, 6))
-plt.imshow(fidelity_matrix.T, aspect='auto', cmap='viridis', interpolation='nearest')
-plt.colorbar(label="Fidelity")
-plt.xlabel("Cycle")
-plt.ylabel("Subsystem Index")
-plt.title("Subsystem Fidelity Dispersion Over Cycles")
-plt.tight_layout()
-plt.savefig("subsystem_fidelity_heatmap.png")
+    plt.figure(figsize=(12, 6))
+    plt.imshow(binned[::step].T, aspect='auto', cmap='viridis', interpolation='nearest',
+               extent=(-0.5, len(binned) - 0.5, subsystems - 0.5, -0.5))
+    plt.colorbar(label="Fidelity")
+    plt.xlabel("Cycle")
+    plt.ylabel("Subsystem Index")
+    plt.title("Subsystem Fidelity Dispersion Over Cycles")
+    plt.tight_layout()
+    plt.savefig("subsystem_fidelity_heatmap.png")
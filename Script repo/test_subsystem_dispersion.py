@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from subsystem_dispersion import bin_means, run_dispersion
+from _urcm_testing import sqrtm_fidelity
+
+def looped_dispersion(subsystems, cycles, noise_level, rng):
+    # The original loop: one subsystem at a time, fidelity then noisy_evolve
+    initial = []
+    for _ in range(subsystems):
+        psi = rng.randn(2) + 1j * rng.randn(2)
+        psi /= np.linalg.norm(psi)
+        initial.append(np.outer(psi, psi.conj()))
+    current = [rho.copy() for rho in initial]
+    matrix = np.zeros((cycles + 1, subsystems))
+    for i in range(cycles + 1):
+        for j in range(subsystems):
+            matrix[i, j] = sqrtm_fidelity(initial[j], current[j], squared=True)  # fidelity_simple
+            noise = noise_level * (rng.randn(2, 2) + 1j * rng.randn(2, 2))
+            rho = current[j] + (noise + noise.conj().T) / 2
+            rho = (rho + rho.conj().T) / 2
+            current[j] = rho / np.trace(rho)
+    return matrix
+
+@pytest.mark.parametrize("subsystems, bins", [(12, 4), (25, 4), (10, 10)])
+def test_streamed_matrix_matches_per_subsystem_loop(tmp_path, subsystems, bins):
+    path = str(tmp_path / "fidelity.npy")
+    expected = looped_dispersion(subsystems, 15, 0.05, np.random.RandomState(subsystems))
+    matrix, binned = run_dispersion(subsystems, 15, 0.05, path, plot_bins=bins, rng=np.random.RandomState(subsystems))
+    assert isinstance(matrix, np.memmap) and matrix.dtype == np.float32
+    assert np.allclose(matrix, expected, atol=1e-5)
+    assert np.allclose(np.load(path), expected, atol=1e-5)
+    assert np.allclose(binned, [bin_means(row, bins) for row in matrix], atol=1e-6)
+
+def test_bin_means_with_uneven_bins():
+    row = np.arange(10.0)
+    edges = [10 * b // 4 for b in range(5)]  # sizes 2, 3, 2, 3
+    expected = [row[lo:hi].mean() for lo, hi in zip(edges[:-1], edges[1:])]
+    assert np.allclose(bin_means(row, 4), expected)
+    assert np.allclose(bin_means(row, 10), row) and np.isclose(bin_means(row, 1)[0], row.mean())
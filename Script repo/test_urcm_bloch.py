@@ -0,0 +1,77 @@
+import numpy as np
+import urcm_bloch
+from urcm_entropy_kernel import von_neumann_entropy
+from urcm_subsystems import run_universes
+from _urcm_testing import eigh_entropy
+
+def random_qubits(n, rng):
+    A = rng.normal(size=(n, 2, 2)) + 1j * rng.normal(size=(n, 2, 2))
+    rho = A @ A.conj().swapaxes(-1, -2)
+    return rho / np.trace(rho, axis1=-2, axis2=-1)[:, None, None]
+
+def test_round_trip_entropy_and_overlap():
+    rng = np.random.default_rng(0)
+    rhos = random_qubits(30, rng)
+    r = urcm_bloch.to_bloch(rhos)
+    assert np.allclose(urcm_bloch.to_density(r), rhos)
+    assert np.allclose(urcm_bloch.von_neumann_entropy(r), [eigh_entropy(rho) for rho in rhos])
+    assert np.allclose(urcm_bloch.trace_overlap(r[:-1], r[1:]),
+                       np.trace(rhos[:-1] @ rhos[1:], axis1=-2, axis2=-1).real)
+    assert np.isclose(urcm_bloch.entropy(urcm_bloch.generate_initial_state()), np.log(2))
+    assert urcm_bloch.entropy(urcm_bloch.entropy_reset(r[0])) == 0
+
+def test_rotation_and_noise_match_matrix_forms():
+    rhos = random_qubits(20, np.random.default_rng(1)).real  # the scripts' states are real
+    rhos = (rhos + rhos.swapaxes(-1, -2)) / 2
+    r = urcm_bloch.to_bloch(rhos)
+
+    theta = np.random.default_rng(2).random(20) * 2 * np.pi
+    U = np.stack([np.stack([np.cos(theta), -np.sin(theta)], -1), np.stack([np.sin(theta), np.cos(theta)], -1)], -2)
+    rotated = urcm_bloch.unitary_evolve(r, np.random.default_rng(2))
+    assert np.allclose(urcm_bloch.to_density(rotated), U @ rhos @ U.swapaxes(-1, -2))
+
+    rng = np.random.default_rng(3)
+    expected = []
+    for rho in rhos:  # apply_noise from the urcm_cycle_sim scripts
+        n = 0.05 * rng.standard_normal((2, 2))
+        rho = rho + (n + n.T) / 2
+        expected.append(rho / np.trace(rho))
+    assert np.allclose(urcm_bloch.to_density(urcm_bloch.apply_noise(r, 0.05, np.random.default_rng(3))), expected)
+
+def test_bloch_subsystems_match_matrix_subsystems():
+    kwargs = dict(num_subsystems=4, reset_prob=0.2, entropy_threshold=1e-3, max_timesteps=200)
+    matrix = run_universes(6, rng=np.random.default_rng(4), **kwargs)
+    bloch = run_universes(6, rng=np.random.default_rng(4), bloch=True, **kwargs)
+    assert matrix[1] == bloch[1] and any(t is not None for t in matrix[1])
+    for a, b in zip(matrix[0], bloch[0]):
+        assert np.allclose(a, b)
+
+def matrix_unitary_evolve(rho):
+    # unitary_evolve of the simulate_entropy_bounce / simulate_50_universe_entropy scripts
+    theta = np.random.rand() * 2 * np.pi
+    U = np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
+    return U @ rho @ U.T.conj()
+
+def scalar_run(evolve, reset, entropy, initial, steps=300, num_subsystems=5, reset_prob=0.05):
+    # The scripts' per-subsystem loop, one scalar state and entropy call at a time
+    np.random.seed(6)
+    states = [initial() for _ in range(num_subsystems)]
+    totals = []
+    for _ in range(steps):
+        total = 0
+        for i in range(num_subsystems):
+            states[i] = reset(states[i]) if np.random.rand() < reset_prob else evolve(states[i])
+            total += entropy(states[i])
+        totals.append(total)
+        if total < 1e-3:
+            break
+    return totals
+
+def test_scripts_scalar_path_through_bloch_backend():
+    matrix = scalar_run(matrix_unitary_evolve, lambda rho: np.array([[1, 0], [0, 0]]),
+                        von_neumann_entropy, lambda: np.eye(2) / 2)
+    bloch = scalar_run(urcm_bloch.unitary_evolve, urcm_bloch.entropy_reset,
+                       urcm_bloch.von_neumann_entropy, urcm_bloch.generate_initial_state)
+    assert len(matrix) == len(bloch) < 300  # same bounce step
+    assert np.allclose(matrix, bloch)
+    assert np.ndim(urcm_bloch.von_neumann_entropy(np.zeros(3))) == 0
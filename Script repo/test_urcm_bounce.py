@@ -0,0 +1,50 @@
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+from urcm_bounce import (density_from_factor, diagonal_factor, factor_entropy, factor_fidelity,
+                         krylov_bounce)
+from urcm_fock_operators import bounce_factor
+from _urcm_testing import eigh_entropy, random_factor, sqrtm_fidelity
+
+def test_krylov_bounce_matches_expm():
+    d = 60
+    H = scipy.sparse.random(d, d, density=0.1, random_state=3)
+    H = (H + H.T) / 2
+    phase = np.exp(1j * 2 * np.pi / 60 * 5)  # non-unitary, as in the scripts
+    F = random_factor(d, 3, np.random.default_rng(3))
+    expected = scipy.linalg.expm(-1j * phase * H.toarray()) @ F
+    assert np.allclose(krylov_bounce(F, H, phase), expected)
+
+def test_krylov_bounce_of_diagonal_factor_matches_spectral_bounce():
+    # urcm_infinite_hilbert_simulation bounces low-rank states this way and full-rank ones by bounce_factor
+    d = 80
+    H = scipy.sparse.random(d, d, density=0.1, random_state=6)
+    H = (H + H.T) / 2
+    spectrum = np.linalg.eigh(H.toarray())
+    diag = np.zeros(d)
+    diag[:6] = np.random.default_rng(6).random(6)
+    diag /= diag.sum()
+    for cycle in (0, 15, 40):
+        F = krylov_bounce(diagonal_factor(diag), H, np.exp(1j * 2 * np.pi / 60 * cycle))
+        assert np.allclose(F / np.linalg.norm(F), bounce_factor(diag, spectrum, cycle))
+
+def test_diagonal_factor_and_density():
+    diag = np.array([0.0, 0.2, 0.0, 0.8])
+    F = diagonal_factor(diag)
+    assert F.shape == (4, 2)
+    assert np.allclose(density_from_factor(F), np.diag(diag))
+
+def test_factor_entropy_matches_dense_spectrum():
+    rng = np.random.default_rng(4)
+    for k in (1, 5, 40):
+        F = random_factor(40, k, rng)
+        assert np.isclose(factor_entropy(F), eigh_entropy(density_from_factor(F), cutoff=1e-15), atol=1e-9)
+
+def test_factor_fidelity_matches_sqrtm():
+    rng = np.random.default_rng(5)
+    for k1, k2 in ((1, 1), (3, 7), (30, 30)):
+        F1, F2 = random_factor(30, k1, rng), random_factor(30, k2, rng)
+        rho1, rho2 = density_from_factor(F1), density_from_factor(F2)
+        assert np.isclose(factor_fidelity(F1, F2), sqrtm_fidelity(rho1, rho2), atol=1e-6)
+    F = random_factor(30, 4, rng)
+    assert np.isclose(factor_fidelity(F, 2 * F), 1.0)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from urcm_checkpoint import Checkpoint
+
+def test_parts_hold_only_new_rows_and_reassemble(tmp_path):
+    path = str(tmp_path / "run.npz")
+    rng = np.random.default_rng(0)
+    checkpoint = Checkpoint(path, rng)
+    x = rng.normal(size=(30, 3))
+    for stop, records in ((10, [{"step": 0, "value": 0.5}]), (30, [{"step": 1, "value": 1.5}, {"step": 2, "value": 2.5}])):
+        checkpoint.save(stop, {"state": x[stop - 1]}, rows={"x": x[stop - 10 if stop == 10 else 10:stop]}, log=records)
+    expected_draw = rng.normal()
+    with np.load(checkpoint.part_path(1)) as part:
+        assert part["rows/x"].shape == (20, 3)
+
+    resumed = Checkpoint(path, rng)
+    rng.normal(size=5)  # moved on; load must restore it
+    cycle, arrays, rows, log = resumed.load()
+    assert cycle == 30 and resumed.parts == 2
+    assert np.array_equal(arrays["state"], x[29])
+    assert np.array_equal(rows["x"], x)
+    assert log == [{"step": 0, "value": 0.5}, {"step": 1, "value": 1.5}, {"step": 2, "value": 2.5}]
+    assert rng.normal() == expected_draw
+
+def test_stale_parts_beyond_head_are_ignored(tmp_path):
+    path = str(tmp_path / "run.npz")
+    old = Checkpoint(path)
+    for k in range(3):
+        old.save(k, rows={"x": np.full(2, k)})
+    fresh = Checkpoint(path)  # a new run over the same path
+    fresh.save(5, rows={"x": np.array([9, 9])})
+    assert np.array_equal(Checkpoint(path).load()[2]["x"], [9, 9])
+
+def test_reserved_names_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        Checkpoint(str(tmp_path / "run.npz")).save(1, {"rng_state": np.zeros(1)})
+
+def test_observer_resume_is_bit_exact(tmp_path):
+    from URCM_Optimized_Observer import run_simulation
+
+    path = str(tmp_path / "observer.npz")
+    np.random.seed(4)
+    full = run_simulation(700)
+    np.random.seed(4)
+    run_simulation(500, path, checkpoint_every=200)  # last save at 400
+    np.random.seed(99)
+    resumed = run_simulation(700, path, checkpoint_every=200, resume=True)
+    for key in ('entropy', 'Λ_trace', 'density_skew', 'cmb_low_l'):
+        assert np.array_equal(full[key], resumed[key], equal_nan=True)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from urcm_cmb import CMBRealisations, autocorrelation, rac
+
+def direct_rac(r, lag):
+    if lag >= len(r):
+        return 0.0
+    return np.dot(r[:len(r) - lag], r[lag:]) / np.dot(r, r)
+
+def test_autocorrelation_matches_direct_sums():
+    x = np.random.default_rng(0).normal(size=(3, 200))
+    acf = autocorrelation(x)
+    expected = [[np.dot(r[:200 - k], r[k:]) for k in range(200)] for r in x]
+    assert np.allclose(acf, expected)
+
+@pytest.mark.parametrize("lags", [50, [0, 1, 50], np.arange(0, 260)])  # direct and FFT paths, lags past n
+def test_rac_matches_dot_products(lags):
+    x = np.random.default_rng(1).normal(size=(4, 250))
+    result = rac(x, lags)
+    expected = np.array([[direct_rac(r, lag) for lag in np.atleast_1d(lags)] for r in x])
+    assert np.allclose(result, expected.reshape(result.shape))
+
+def test_rac_rejects_negative_lags():
+    x = np.random.default_rng(2).normal(size=(2, 100))
+    with pytest.raises(ValueError):
+        rac(x, np.arange(-3, 20))
+    with pytest.raises(ValueError):
+        rac(x, -1)
+
+def test_batched_metrics_match_single_realisation_loop():
+    from scipy.ndimage import gaussian_filter1d
+    from scipy.stats import skew
+
+    engine = CMBRealisations(300, scan_lags=[10, 50])
+    metrics = engine.run(5, chunk_size=2, rng=np.random.default_rng(3))
+    rng = np.random.default_rng(3)
+    noise = rng.normal(0, engine.noise_scales, (5, 2, 300))
+    for k in range(5):
+        sim = gaussian_filter1d(engine.base + engine.echo + noise[k, 0], 5)
+        base = gaussian_filter1d(engine.base + noise[k, 1], 5)
+        residual = sim - base
+        assert np.isclose(metrics['ΔCℓ²'][k], np.mean(residual ** 2))
+        assert np.isclose(metrics['Sₑ'][k], skew(sim))
+        assert np.isclose(metrics['PNRC'][k], np.max(residual) / np.std(base))
+        assert np.isclose(metrics['RAC'][k], direct_rac(residual, 50))
+        assert np.allclose(metrics['RAC_scan'][k], [direct_rac(residual, 10), direct_rac(residual, 50)])
@@ -0,0 +1,47 @@
+import numpy as np
+from urcm_ensemble import apply_noise, entropy, initial_ensemble, simulate_ensemble, step_until_bounce
+from _urcm_testing import eigh_entropy
+
+def looped_bounces(num_universes, max_timesteps, gamma, entropy_threshold, rng):
+    # One rho at a time, as in the 50-universe scripts, drawing the same noise as the batch
+    rhos = list(initial_ensemble(num_universes))
+    bounce_times = np.full(num_universes, -1)
+    active = list(range(num_universes))
+    for t in range(max_timesteps):
+        noise = gamma * rng.standard_normal((len(active), 2, 2))
+        still_active = []
+        for i, n in zip(active, noise):
+            rho = rhos[i] + (n + n.T) / 2
+            rho = (rho + rho.conj().T) / 2
+            rhos[i] = rho / np.trace(rho)
+            if eigh_entropy(rhos[i]) < entropy_threshold:
+                bounce_times[i] = t
+            else:
+                still_active.append(i)
+        active = still_active
+        if not active:
+            break
+    return bounce_times, np.array(rhos)
+
+def test_entropy_matches_eigvalsh():
+    rhos = apply_noise(initial_ensemble(50, dim=3), 0.05, np.random.default_rng(0))
+    assert np.allclose(entropy(rhos), [eigh_entropy(rho) for rho in rhos], atol=1e-12)
+
+def test_noise_keeps_states_hermitian_with_unit_trace():
+    rhos = apply_noise(initial_ensemble(20), 0.1, np.random.default_rng(1))
+    assert np.allclose(rhos, rhos.swapaxes(-1, -2).conj())
+    assert np.allclose(np.trace(rhos, axis1=-2, axis2=-1), 1)
+    assert np.array_equal(apply_noise(initial_ensemble(3), 0.0), initial_ensemble(3))
+
+def test_masked_stepping_matches_per_universe_loop():
+    args = (40, 60, 0.05, 0.3)
+    expected_times, expected_states = looped_bounces(*args, np.random.default_rng(2))
+    times, states = step_until_bounce(initial_ensemble(args[0]), *args[1:], rng=np.random.default_rng(2))
+    assert (expected_times >= 0).any() and (expected_times < 0).any()
+    assert np.array_equal(times, expected_times)
+    assert np.allclose(states, expected_states)
+
+def test_chunks_and_no_bounce():
+    assert np.array_equal(simulate_ensemble(7, max_timesteps=5, gamma=0.0, chunk_size=3), np.full(7, -1))
+    whole = simulate_ensemble(6, 200, 0.05, 0.3, rng=np.random.default_rng(3))
+    assert whole.shape == (6,) and (whole >= -1).all()
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from urcm_entropy_kernel import below_threshold, eigvalsh_small, von_neumann_entropy
+from _urcm_testing import eigh_entropy, random_state
+
+@pytest.mark.parametrize("d", [2, 3, 5])
+def test_entropy_matches_eigvalsh(d):
+    rng = np.random.default_rng(d)
+    rhos = np.array([random_state(d, rng, complex_=k % 2 == 0) for k in range(40)])
+    expected = [eigh_entropy(rho) for rho in rhos]
+    assert np.allclose([von_neumann_entropy(rho) for rho in rhos], expected, atol=1e-12)
+    assert np.allclose(von_neumann_entropy(rhos), expected, atol=1e-12)
+    assert np.allclose(eigvalsh_small(rhos), np.linalg.eigvalsh(rhos), atol=1e-12)
+
+def test_entropy_pure_mixed_and_base():
+    assert von_neumann_entropy(np.diag([1.0, 0.0])) == 0.0
+    assert np.isclose(von_neumann_entropy(np.eye(2) / 2), np.log(2))
+    assert np.isclose(von_neumann_entropy(np.eye(2) / 2, base=2), 1.0)
+    assert np.isclose(von_neumann_entropy(np.eye(4) / 4, base=2), 2.0)
+
+@pytest.mark.parametrize("threshold", [0.05, 0.3, 0.6, 0.69, 1.0, -0.1])
+def test_below_threshold_matches_entropy(threshold):
+    rng = np.random.default_rng(int(abs(threshold) * 100))
+    for trial in range(300):
+        rho = random_state(2, rng, complex_=trial % 2 == 0)
+        if trial % 3 == 1:  # noisy states can leave the PSD cone
+            noise = 0.3 * rng.normal(size=(2, 2))
+            rho = rho + (noise + noise.T) / 2
+            rho = rho / np.trace(rho).real
+        if trial % 7 == 0:  # off unit trace: falls back to the entropy
+            rho = 1.2 * rho
+        assert below_threshold(rho, threshold) == (eigh_entropy(rho) < threshold)
+
+def test_below_threshold_near_the_boundary():
+    for threshold in (0.1, 0.5):
+        # bracket the radius where entropy(1/2 ± r) == threshold
+        radii = np.linspace(0, 0.5, 20001)
+        entropies = [eigh_entropy(np.diag([0.5 + r, 0.5 - r])) for r in radii]
+        k = np.searchsorted(-np.array(entropies), -threshold)
+        for r in radii[k - 2:k + 2]:
+            rho = np.array([[0.5, r], [r, 0.5]])
+            assert below_threshold(rho, threshold) == (eigh_entropy(rho) < threshold)
+
+def test_below_threshold_on_larger_states():
+    rng = np.random.default_rng(9)
+    for _ in range(20):
+        rho = random_state(3, rng)
+        assert below_threshold(rho, 0.8) == (eigh_entropy(rho) < 0.8)
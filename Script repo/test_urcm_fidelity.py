@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from urcm_fidelity import FixedReferenceFidelity, fidelity, qubit_fidelity, sqrt_psd
+from _urcm_testing import random_state, sqrtm_fidelity
+
+def noisy(rho, rng, level=0.1):
+    noise = level * (rng.normal(size=rho.shape) + 1j * rng.normal(size=rho.shape))
+    rho = rho + (noise + noise.conj().T) / 2
+    return rho / np.trace(rho)
+
+@pytest.mark.parametrize("d", [2, 4])
+def test_fidelity_matches_sqrtm(d):
+    rng = np.random.default_rng(d)
+    for trial in range(50):
+        rho1 = random_state(d, rng, rank=1 if trial % 2 == 0 else None)
+        rho2 = random_state(d, rng)
+        for _ in range(trial % 5):  # noise can leave rho2 slightly non-PSD
+            rho2 = noisy(rho2, rng)
+        assert np.isclose(fidelity(rho1, rho2), sqrtm_fidelity(rho1, rho2, squared=True), atol=1e-7)
+
+def test_stacked_and_cached_reference():
+    rng = np.random.default_rng(0)
+    for d in (2, 3):
+        refs = np.array([random_state(d, rng) for _ in range(6)])
+        states = np.array([noisy(r, rng) for r in refs])
+        expected = [sqrtm_fidelity(a, b, squared=True) for a, b in zip(refs, states)]
+        assert np.allclose(fidelity(refs, states), expected, atol=1e-7)
+        assert np.allclose(FixedReferenceFidelity(refs)(states), expected, atol=1e-7)
+
+def test_qubit_closed_form_identities():
+    rng = np.random.default_rng(1)
+    rho = random_state(2, rng)
+    assert np.isclose(qubit_fidelity(rho, rho), 1.0)
+    assert np.isclose(qubit_fidelity(np.diag([1.0, 0]), np.diag([0, 1.0])), 0.0)
+
+def test_sqrt_psd_squares_back():
+    rho = random_state(5, np.random.default_rng(2))
+    s = sqrt_psd(rho)
+    assert np.allclose(s @ s, rho)
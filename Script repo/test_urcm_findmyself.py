@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+import urcm_findmyself
+
+# The per-state definitions the vectorised metrics replaced
+ORIGINAL = {
+    "operator_fingerprint": lambda states: np.mean([np.linalg.norm(np.fft.fft(s)) for s in states]),
+    "bounce_density_peak": lambda states: np.max([np.abs(s).max() for s in states]),
+    "teleology": lambda states: np.sum(np.real(states[-1])**2),
+    "spectral_entropy_variation": lambda states: np.std(np.abs(np.fft.fft([np.mean(np.real(s)) for s in states]))),
+    "recursive_energy_ratio": lambda states: np.linalg.norm(states[-1]) / (np.linalg.norm(states[0]) + 1e-12),
+    "coherence_persistence": lambda states: np.mean([np.real(np.vdot(s, states[0])) for s in states]),
+    "bounce_entropy_gradient": lambda states: np.mean(np.gradient([np.linalg.norm(s)**2 for s in states])),
+}
+
+def seeded_window(n, seed, dim=16):
+    # Consecutive states of the recursion, as the ring buffer holds them
+    np.random.seed(seed)
+    state = np.random.rand(dim) + 1j * np.random.rand(dim)
+    states = []
+    for i in range(n):
+        state = urcm_findmyself.recursive_R_operator(state, i) if i % 3 else urcm_findmyself.temporal_modulation(state, i)
+        states.append(state * (1 + 0.1 * i))  # vary the norms so the ratio/gradient metrics are not trivial
+    return np.array(states)
+
+@pytest.mark.parametrize("n", [2, 7, 100])
+def test_window_metrics_match_per_state_definitions(n):
+    states = seeded_window(n, n)
+    record = urcm_findmyself.window_metrics(states)
+    assert set(record) == set(ORIGINAL)
+    for name, original in ORIGINAL.items():
+        assert np.isclose(record[name], original(list(states))), name
+
+def test_single_state_window():
+    record = urcm_findmyself.window_metrics(seeded_window(1, 0))
+    assert record["bounce_entropy_gradient"] == 0.0
+    assert np.isclose(record["recursive_energy_ratio"], 1.0)
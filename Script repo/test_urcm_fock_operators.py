@@ -0,0 +1,62 @@
+import numpy as np
+import scipy.linalg
+from urcm_fock_operators import (apply_bounce, apply_compression, apply_reset, bounce_factor, bounce_unitary,
+                                 compression_weights, reset_weights)
+from _urcm_testing import random_state
+
+def kraus_reset(rho, d, sigma, modes):
+    # The script's original continuous Kraus sum over Gaussian-weighted Fock projectors
+    lambdas = np.linspace(-1, 1, 100)
+    f_lambda = np.exp(-lambdas**2 / (2 * sigma**2)) / np.sqrt(2 * np.pi * sigma**2)
+    f_lambda /= np.sum(f_lambda)
+    rho_out = np.zeros_like(rho)
+    for f, lam in zip(f_lambda, lambdas):
+        K = np.zeros((d, d))
+        level = int(modes * (lam + 1) / 2)
+        if level < d:
+            K[level, level] = np.sqrt(f)
+        rho_out += K @ rho @ K.conj().T
+    return rho_out / np.trace(rho_out).real
+
+def test_compression_matches_projector_on_matrices_and_populations():
+    d, modes = 80, 40
+    rho = random_state(d, np.random.default_rng(0))
+    p = compression_weights(d, modes)
+    P = sum(np.outer(np.eye(d)[i], np.eye(d)[i]) for i in range(modes // 2)) / (modes // 2)
+    expected = P @ rho @ P.conj().T
+    expected /= np.trace(expected).real
+    assert np.allclose(apply_compression(rho, p), expected)
+    assert np.allclose(apply_compression(np.diagonal(rho).real, p), np.diagonal(expected).real)
+
+def test_reset_matches_kraus_sum():
+    d, modes, sigma = 60, 100, 0.1  # some Kraus levels fall outside the truncated space
+    rho = random_state(d, np.random.default_rng(1))
+    expected = np.diagonal(kraus_reset(rho, d, sigma, modes)).real
+    w = reset_weights(d, sigma, modes)
+    assert np.allclose(apply_reset(rho, w), expected)
+    assert np.allclose(apply_reset(np.diagonal(rho).real, w), expected)
+
+def test_bounce_matches_dense_expm():
+    d = 30
+    rng = np.random.default_rng(2)
+    A = rng.normal(size=(d, d)) + 1j * rng.normal(size=(d, d))
+    H = (A + A.conj().T) / 2
+    U = bounce_unitary(H, 7)
+    assert np.allclose(U, scipy.linalg.expm(-1j * H * np.exp(1j * 2 * np.pi / 60 * 7)))
+    diag = np.zeros(d)
+    diag[[1, 4, 9]] = [0.5, 0.3, 0.2]
+    expected = U @ np.diag(diag) @ U.conj().T
+    assert np.allclose(apply_bounce(diag, U), expected / np.trace(expected).real)
+
+def test_bounce_factor_matches_dense_bounce():
+    d = 40
+    rng = np.random.default_rng(3)
+    A = rng.normal(size=(d, d)) + 1j * rng.normal(size=(d, d))
+    H = (A + A.conj().T) / 2
+    spectrum = np.linalg.eigh(H)
+    for diag in (np.r_[0.6, 0.4, np.zeros(d - 2)], rng.random(d)):  # low-rank and full-rank states
+        diag = diag / diag.sum()
+        for cycle in (0, 15):  # unitary and strongly non-unitary phase
+            F = bounce_factor(diag, spectrum, cycle)
+            assert F.shape == (d, np.count_nonzero(diag))
+            assert np.allclose(F @ F.conj().T, apply_bounce(diag, bounce_unitary(H, cycle)))
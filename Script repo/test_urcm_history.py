@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from urcm_history import RingBuffer
+
+def test_window_is_last_states_in_order():
+    buffer = RingBuffer(4, 2, dtype=float)
+    history = []
+    for k in range(11):
+        state = np.array([k, -k], dtype=float)
+        buffer.append(state)
+        history.append(state)
+        assert len(buffer) == min(k + 1, 4)
+        assert np.array_equal(buffer.window(), history[-4:])
+        assert np.array_equal(buffer.window(2), history[-2:])
+        assert np.array_equal(buffer.latest(), state)
+
+def test_window_is_a_read_only_view():
+    buffer = RingBuffer(3, 2)
+    for k in range(5):
+        buffer.append(np.full(2, k))
+    view = buffer.window()
+    assert np.shares_memory(view, buffer._data)
+    with pytest.raises(ValueError):
+        view[0] = 0
+    assert len(buffer.window(10)) == 3
@@ -0,0 +1,90 @@
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+import pytest
+from urcm_lowrank import DENSE_MAX_DIM, LowRankState, fidelity
+from _urcm_testing import eigh_entropy, random_factor, sqrtm_fidelity
+
+def lowrank_state(d, k, rng, p0=0.0):
+    return LowRankState(random_factor(d, k, rng), (1 - p0) * rng.dirichlet(np.ones(k)), p0)
+
+def random_unitary(d, rng):
+    return np.linalg.qr(random_factor(d, d, rng))[0]
+
+def assert_eigenvector(rho, psi, which="lowest"):
+    vals = np.linalg.eigvalsh(rho)
+    value = vals[0] if which == "lowest" else vals[-1]
+    psi = np.ravel(psi)
+    assert np.isclose(np.linalg.norm(psi), 1)
+    assert np.allclose(rho @ psi, value * psi, atol=1e-8 * max(1, abs(vals).max()))
+
+def test_factor_matches_dense():
+    rng = np.random.default_rng(0)
+    state = lowrank_state(30, 4, rng, p0=0.2)
+    rho = state.to_dense()
+    assert np.allclose(rho, rho.conj().T)
+    x = random_factor(30, 2, rng)
+    assert np.allclose(state.matvec(x), rho @ x)
+    assert np.isclose(state.entropy(), eigh_entropy(rho, cutoff=1e-15))
+    assert np.allclose(state.depolarize(0.3).to_dense(), 0.7 * rho + 0.3 * np.eye(30) / 30)
+    U = random_unitary(30, rng)
+    assert np.allclose(state.evolve(U).to_dense(), U @ rho @ U.conj().T)
+
+def test_rank_deficient_factor_is_trimmed():
+    rng = np.random.default_rng(1)
+    V = random_factor(20, 2, rng)
+    state = LowRankState(np.hstack([V, V[:, :1]]), [0.3, 0.3, 0.4])
+    assert state.rank == 2
+    assert np.isclose(state.entropy(), eigh_entropy(state.to_dense(), cutoff=1e-15))
+
+def test_bounce_matches_expm():
+    rng = np.random.default_rng(2)
+    d = 40
+    H = scipy.sparse.random(d, d, density=0.1, random_state=2)
+    H = (H + H.T) / 2
+    state = LowRankState.pure(random_factor(d, 1, rng))
+    U = scipy.linalg.expm(-1j * H.toarray())
+    assert np.allclose(state.bounce(H).to_dense(), U @ state.to_dense() @ U.conj().T)
+
+@pytest.mark.parametrize("which", ["lowest", "dominant"])
+def test_dense_reset_matches_eigh(which):
+    rng = np.random.default_rng(3)
+    state = lowrank_state(50, 3, rng, p0=0.1)
+    compressed = state.compress(random_factor(50, 50, rng))
+    assert_eigenvector(compressed.to_dense(), compressed.reset(which).V, which)
+
+def test_null_vector_reset():
+    rng = np.random.default_rng(4)
+    d = DENSE_MAX_DIM + 44
+    compressed = lowrank_state(d, 3, rng).compress(random_factor(d, d, rng))
+    psi = np.ravel(compressed.reset("lowest").V)
+    assert np.isclose(np.linalg.norm(psi), 1)
+    assert np.linalg.norm(compressed.matvec(psi)) < 1e-10 * np.linalg.norm(compressed.to_dense())
+
+def test_woodbury_reset_matches_eigh():
+    rng = np.random.default_rng(5)
+    d = DENSE_MAX_DIM + 44
+    P = np.eye(d) + 0.1 * random_factor(d, d, rng) / np.sqrt(d)  # well-conditioned compression
+    compressed = lowrank_state(d, 3, rng, p0=0.3).compress(P)
+    assert_eigenvector(compressed.to_dense(), compressed.reset("lowest").V)
+
+def test_iterative_dominant_reset_matches_eigh():
+    rng = np.random.default_rng(6)
+    d = DENSE_MAX_DIM + 44
+    compressed = lowrank_state(d, 3, rng, p0=0.3).compress(random_factor(d, d, rng))
+    assert_eigenvector(compressed.to_dense(), compressed.reset("dominant").V, "dominant")
+
+@pytest.mark.parametrize("p0a, p0b", [(0.2, 0.0), (0.2, 0.4)])  # sqrt(rho_a) needs rho_a full rank
+def test_fidelity_matches_sqrtm(p0a, p0b):
+    rng = np.random.default_rng(7)
+    a = lowrank_state(25, 3, rng, p0=p0a)
+    b = lowrank_state(25, 2, rng, p0=p0b)
+    assert np.isclose(fidelity(a, b), sqrtm_fidelity(a.to_dense(), b.to_dense()), atol=1e-6)
+
+def test_fidelity_of_pure_states_is_overlap():
+    rng = np.random.default_rng(8)
+    psi, phi = random_factor(20, 1, rng), random_factor(20, 1, rng)
+    psi, phi = psi / np.linalg.norm(psi), phi / np.linalg.norm(phi)
+    expected = abs(np.vdot(psi, phi))
+    assert np.isclose(fidelity(LowRankState.pure(psi), LowRankState.pure(phi)), expected)
+    assert np.isclose(fidelity(LowRankState.pure(psi), LowRankState.pure(psi)), 1.0)
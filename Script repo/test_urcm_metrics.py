@@ -0,0 +1,36 @@
+import numpy as np
+import qutip
+import scipy.sparse
+from urcm_metrics import (basis_entropy, entropy_vn, ket_entropy, l1_coherence, participation_ratio, purity,
+                          relative_entropy_coherence)
+
+def random_ket(d, rng):
+    psi = rng.normal(size=d) + 1j * rng.normal(size=d)
+    return psi / np.linalg.norm(psi)
+
+def test_density_metrics_match_qutip_and_loops():
+    rho = qutip.rand_dm(6, seed=1)
+    dense = rho.full()
+    assert np.isclose(entropy_vn(rho), qutip.entropy_vn(rho))
+    assert np.isclose(purity(rho), (rho * rho).tr().real)
+    l1 = sum(abs(dense[i, j]) for i in range(6) for j in range(6) if i != j)
+    assert np.isclose(l1_coherence(rho), l1)
+    assert np.isclose(relative_entropy_coherence(rho), qutip.entropy_vn(qutip.Qobj(np.diag(np.diag(dense)))) - qutip.entropy_vn(rho))
+    for form in (dense, scipy.sparse.csr_matrix(dense)):
+        assert np.isclose(entropy_vn(form), qutip.entropy_vn(rho))
+        assert np.isclose(l1_coherence(form), l1)
+        assert np.isclose(purity(form), (rho * rho).tr().real)
+
+def test_ket_forms_match_density_forms():
+    psi = random_ket(8, np.random.default_rng(2))
+    rho = np.outer(psi, psi.conj())
+    for ket in (psi, psi[:, None], qutip.Qobj(psi[:, None])):
+        assert np.isclose(purity(ket), purity(rho))
+        assert np.isclose(basis_entropy(ket), basis_entropy(rho))
+        assert np.isclose(participation_ratio(ket), participation_ratio(rho))
+    assert np.isclose(basis_entropy(np.ones(4) / 2), 2.0)
+
+def test_ket_functions_reduce_batches():
+    rng = np.random.default_rng(3)
+    batch = np.array([random_ket(5, rng) for _ in range(4)])
+    assert np.allclose(ket_entropy(batch), [ket_entropy(psi) for psi in batch])
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+import scipy.stats
+import URCM_Optimized_Observer as observer
+
+def run(cycles, seed, **kwargs):
+    np.random.seed(seed)
+    return observer.run_simulation(cycles, **kwargs)
+
+def test_one_universe_batch_matches_scalar_run():
+    scalar = run(700, 3)
+    batched = run(700, 3, universes=1)
+    for key, value in scalar.items():
+        if isinstance(batched[key], list):  # per-universe event lists
+            assert np.array_equal(value, batched[key][0])
+        elif key.startswith('clock'):
+            assert np.array_equal(value, batched[key])
+        else:
+            assert np.array_equal(value, batched[key][:, 0], equal_nan=True)
+
+def test_ensemble_aggregates_match_per_universe_metrics():
+    metrics = run(700, 5, universes=4)
+    counts = [len(events) for events in metrics['coincidence_events']]
+    assert np.array_equal(metrics['coincidence_counts'], counts)
+    per_cycle = np.zeros(701, dtype=int)
+    for events in metrics['coincidence_events']:
+        per_cycle[events] += 1
+    assert np.array_equal(metrics['ensemble_coincidences'], per_cycle)
+    assert metrics['coincidence_rate'] == np.mean(np.array(counts) > 0)
+    assert metrics['cmb_low_l'].shape == (701 - 500, 4)
+
+def test_blocked_density_moments_match_full_history(monkeypatch):
+    # Replay the cycles keeping every density, as the series did before it was streamed
+    cycles = 600
+    np.random.seed(7)
+    series = observer.allocate_series(cycles + 1, universes=2)
+    series['entropy'][0], series['Λ'][0] = 0.0, 0.7
+    history = [np.full((2, 10, 10), 0.5, dtype=observer.DENSITY_DTYPE)]
+    for i in range(cycles):
+        history.append(observer.recursive_universe_step(series, history[-1], i, series['Λ'][i]))
+    grids = np.array(history, dtype=np.float64).reshape(cycles + 1, 2, -1)
+    spread = np.std(grids, axis=-1)
+    envelope = [np.std(spread[k:k + 500], axis=0) for k in range(cycles + 1 - 500)]
+
+    monkeypatch.setattr(observer, "DENSITY_BLOCK_BYTES", 7 * history[0].nbytes)  # blocks of 7 rows
+    metrics = run(cycles, 7, universes=2)
+    assert np.array_equal(metrics['density_skew'], scipy.stats.skew(grids, axis=-1), equal_nan=True)
+    assert np.allclose(metrics['cmb_low_l'], envelope, rtol=1e-6)
+
+def test_resume_without_checkpoint_path_is_rejected():
+    with pytest.raises(ValueError):
+        observer.run_simulation(10, resume=True)
+
+def test_float32_grid_is_opt_in_and_close():
+    exact = run(700, 9)
+    lossy = run(700, 9, density_dtype=np.float32)
+    assert np.array_equal(exact['entropy'], lossy['entropy'])
+    assert not np.array_equal(exact['cmb_low_l'], lossy['cmb_low_l'])
+    assert np.allclose(lossy['cmb_low_l'], exact['cmb_low_l'], rtol=0.05)
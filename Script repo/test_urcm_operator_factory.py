@@ -0,0 +1,48 @@
+import threading
+
+import numpy as np
+import scipy.linalg
+from urcm_operator_factory import OperatorFactory
+
+def test_draws_depend_only_on_key():
+    a = OperatorFactory(20, seed=3)
+    b = OperatorFactory(20, seed=3)
+    b.get("ket", 5)  # different call order
+    assert np.array_equal(a.get("projector", 2), b.get("projector", 2))
+    assert np.array_equal(a.get("ket", 5), b.get("ket", 5))
+    assert not np.array_equal(a.get("ket", 5), OperatorFactory(20, seed=4).get("ket", 5))
+
+def test_hamiltonian_is_hermitian_and_unitary_matches_expm():
+    factory = OperatorFactory(30, seed=1, density=0.3)
+    H = factory.get("hamiltonian", 0).toarray()
+    assert np.allclose(H, H.conj().T)
+    assert np.allclose(factory.get("unitary", 0), scipy.linalg.expm(-1j * H))
+
+def test_spectrum_diagonalises_hamiltonian():
+    factory = OperatorFactory(25, seed=5, density=0.3)
+    vals, vecs = factory.get("spectrum", 1)
+    H = factory.get("hamiltonian", 1).toarray()
+    assert np.allclose((vecs * vals) @ vecs.conj().T, H)
+
+def test_lru_evicts_oldest():
+    factory = OperatorFactory(4, maxsize=2)
+    for cycle in range(3):
+        factory.get("ket", cycle)
+    assert list(factory._cache) == [("ket", 1), ("ket", 2)]
+
+def test_prefetched_unitary_with_queued_hamiltonian_does_not_deadlock():
+    factory = OperatorFactory(40, seed=2, density=0.2)
+    result = {}
+
+    def run():
+        factory.prefetch("unitary", [0])
+        factory.prefetch("hamiltonian", [0])
+        result["U"] = factory.get("unitary", 0)
+        factory.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive()
+    H = OperatorFactory(40, seed=2, density=0.2).get("hamiltonian", 0).toarray()
+    assert np.allclose(result["U"], scipy.linalg.expm(-1j * H))
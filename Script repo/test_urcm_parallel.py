@@ -0,0 +1,25 @@
+import numpy as np
+from urcm_parallel import run_parallel, split_results, universe_seeds
+
+def generator_universe(length, rng=None):
+    trace = rng.random(length)
+    return trace, int(np.argmax(trace))
+
+def legacy_universe(length):
+    trace = np.random.rand(length)  # draws from the global state, as the scripts' run_universe() does
+    return trace, int(np.argmax(trace))
+
+def test_results_do_not_depend_on_worker_count():
+    for func in (generator_universe, legacy_universe):
+        serial = run_parallel(func, 5, 4, seed=7, max_workers=1)
+        pooled = run_parallel(func, 5, 4, seed=7, max_workers=2, chunksize=2)
+        for (a, ta), (b, tb) in zip(serial, pooled):
+            assert np.array_equal(a, b) and ta == tb
+
+def test_universes_get_distinct_streams_keyed_by_seed():
+    traces, _ = split_results(run_parallel(generator_universe, 4, 3, seed=1, max_workers=1))
+    assert len({t.tobytes() for t in traces}) == 4
+    first = np.random.default_rng(universe_seeds(4, seed=1)[0]).random(3)
+    assert np.array_equal(traces[0], first)
+    other, _ = split_results(run_parallel(generator_universe, 4, 3, seed=2, max_workers=1))
+    assert not np.array_equal(traces[0], other[0])
@@ -0,0 +1,27 @@
+import numpy as np
+from urcm_pure_states import add_noise, decohere, entropy, normalise, project_argmax, random_states
+
+def test_draws_follow_the_per_universe_loop_order():
+    rng = np.random.RandomState(0)
+    expected = []
+    for _ in range(4):
+        psi = rng.rand(6) + 1j * rng.rand(6)
+        expected.append(psi / np.linalg.norm(psi))
+    noisy = [psi + rng.normal(0, 0.1, 6) + 1j * rng.normal(0, 0.1, 6) for psi in expected]
+
+    rng = np.random.RandomState(0)
+    states = random_states(4, 6, rng)
+    assert np.allclose(states, expected)
+    assert np.allclose(add_noise(states, 0.1, rng), noisy)
+
+def test_normalise_and_decohere_keep_unit_rows():
+    states = np.array([[3.0, 4.0], [0.0, 0.0]])
+    assert np.allclose(normalise(states), [[0.6, 0.8], [0.0, 0.0]])
+    assert np.allclose(np.linalg.norm(decohere(random_states(5, 3), 0.2), axis=1), 1)
+
+def test_project_argmax_with_and_without_mask():
+    states = normalise(np.array([[0.1, 0.9, 0.2], [0.8, 0.1, 0.1j]]))
+    assert np.array_equal(project_argmax(states), [[0, 1, 0], [1, 0, 0]])
+    masked = project_argmax(states, where=np.array([False, True]))
+    assert np.array_equal(masked[0], states[0]) and np.array_equal(masked[1], [1, 0, 0])
+    assert np.allclose(entropy(project_argmax(states)), 0)
@@ -0,0 +1,22 @@
+import numpy as np
+from urcm_ragged import load_traces, pack_traces, save_traces
+
+TRACES = [np.arange(3.0), np.array([]), np.linspace(0, 1, 5)]
+
+def test_pack_and_index():
+    ragged = pack_traces(TRACES)
+    assert len(ragged) == 3 and list(ragged.lengths()) == [3, 0, 5]
+    for got, expected in zip(ragged, TRACES):
+        assert np.array_equal(got, expected)
+    assert np.array_equal(ragged[-1], TRACES[-1])
+    assert np.shares_memory(ragged[2], ragged.values)
+
+def test_save_and_memory_mapped_load(tmp_path):
+    stem = save_traces(str(tmp_path / "traces.npy"), TRACES)
+    assert stem == str(tmp_path / "traces")
+    loaded = load_traces(stem + ".values.npy")
+    assert isinstance(loaded.values, np.memmap)
+    for got, expected in zip(loaded, TRACES):
+        assert np.array_equal(got, expected)
+    eager = load_traces(stem, mmap_mode=None)
+    assert not isinstance(eager.values, np.memmap) and np.array_equal(eager[0], TRACES[0])
@@ -0,0 +1,44 @@
+import numpy as np
+import scipy.sparse
+import pytest
+from scipy.sparse.linalg import aslinearoperator
+from urcm_reset import EntropyReset, extremal_eigenvector
+
+def compressed_state(d, rng, rank=5):
+    A = rng.normal(size=(d, rank)) + 1j * rng.normal(size=(d, rank))
+    rho = A @ A.conj().T + 1e-3 * np.diag(rng.random(d))
+    return rho / np.trace(rho).real
+
+def assert_eigenvector(rho, v, value):
+    assert np.isclose(np.linalg.norm(v), 1)
+    assert np.allclose(rho @ v, value * v, atol=1e-8)
+
+@pytest.mark.parametrize("d", [10, 150])  # dense LAPACK and ARPACK / shift-invert paths
+@pytest.mark.parametrize("which", ["lowest", "dominant"])
+def test_matches_eigh(d, which):
+    rho = compressed_state(d, np.random.default_rng(d))
+    w = np.linalg.eigvalsh(rho)
+    value = w[0] if which == "lowest" else w[-1]
+    for form in (rho, scipy.sparse.csr_matrix(rho), aslinearoperator(rho)):
+        assert_eigenvector(rho, extremal_eigenvector(form, which), value)
+
+def test_sparse_lowest_shift_invert_and_degenerate_fallback():
+    n = 400
+    tri = scipy.sparse.diags([np.full(n - 1, -1.0), np.linspace(2.001, 3, n), np.full(n - 1, -1.0)], [-1, 0, 1], format="csr")
+    assert_eigenvector(tri.toarray(), extremal_eigenvector(tri, "lowest"), np.linalg.eigvalsh(tri.toarray())[0])
+    H = scipy.sparse.random(n, n, density=0.004, random_state=1)
+    singular = (H @ H.T).tocsr()  # many-fold null space
+    v = extremal_eigenvector(singular, "lowest")
+    assert np.isclose(np.linalg.norm(v), 1) and np.linalg.norm(singular @ v) < 1e-8
+
+def test_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        extremal_eigenvector(np.eye(3), "largest")
+
+def test_entropy_reset_warm_starts_from_previous_vector():
+    rho = compressed_state(120, np.random.default_rng(7))
+    reset = EntropyReset("dominant")
+    first = reset.eigenvector(rho)
+    assert reset.v0 is first
+    second = reset.eigenvector(rho)
+    assert np.isclose(abs(np.vdot(first, second)), 1)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+import scipy.stats
+from urcm_rolling import rolling_mean, rolling_skew, rolling_std
+
+def windows(x, window):
+    return [x[k:k + window] for k in range(len(x) - window + 1)]
+
+@pytest.mark.parametrize("window", [1, 3, 50])
+def test_matches_per_window_loop(window):
+    x = np.random.default_rng(window).normal(size=400)
+    assert np.allclose(rolling_mean(x, window), [np.mean(w) for w in windows(x, window)])
+    assert np.allclose(rolling_std(x, window), [np.std(w) for w in windows(x, window)])
+    if window > 1:
+        assert np.allclose(rolling_std(x, window, ddof=1), [np.std(w, ddof=1) for w in windows(x, window)])
+    if window > 2:
+        assert np.allclose(rolling_skew(x, window), [scipy.stats.skew(w) for w in windows(x, window)])
+
+def test_small_spread_on_large_trend():
+    # A slowly drifting metric: naive cumulative sums over the whole series would cancel
+    t = np.arange(20_000)
+    x = 1e6 + 10.0 * t + np.random.default_rng(0).normal(scale=1e-2, size=t.size)
+    window = 25
+    expected = [scipy.stats.skew(w) for w in windows(x, window)[::97]]
+    assert np.allclose(rolling_skew(x, window)[::97], expected, atol=1e-6)
+    assert np.allclose(rolling_std(x, window)[::97], [np.std(w) for w in windows(x, window)[::97]], rtol=1e-8)
+
+def test_columns_are_independent_series():
+    x = np.random.default_rng(1).normal(size=(120, 3))
+    for col in range(3):
+        assert np.allclose(rolling_skew(x, 10)[:, col], rolling_skew(x[:, col], 10))
+
+def test_short_series_and_constant_windows():
+    assert rolling_mean(np.arange(3.0), 5).shape == (0,)
+    skew = rolling_skew(np.r_[np.zeros(5), np.arange(1.0, 6.0)], 5)
+    assert np.isnan(skew[0]) and np.isfinite(skew[1:]).all()
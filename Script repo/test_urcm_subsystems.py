@@ -0,0 +1,31 @@
+import numpy as np
+from urcm_subsystems import initial_subsystems, run_universe, run_universes, step_subsystems
+from _urcm_testing import eigh_entropy
+
+def test_step_matches_per_subsystem_loop():
+    states = step_subsystems(initial_subsystems((3, 5)), 0.0, np.random.default_rng(0))
+    rng = np.random.default_rng(1)
+    resets = rng.random((3, 5)) < 0.3
+    theta = rng.random((3, 5)) * 2 * np.pi
+    expected = states.copy()
+    for idx in np.ndindex(3, 5):  # unitary_evolve / entropy_reset of simulate_500_universe_entropy.py
+        if resets[idx]:
+            expected[idx] = np.array([[1, 0], [0, 0]])
+        else:
+            U = np.array([[np.cos(theta[idx]), -np.sin(theta[idx])], [np.sin(theta[idx]), np.cos(theta[idx])]])
+            expected[idx] = U @ states[idx] @ U.T.conj()
+    assert np.allclose(step_subsystems(states, 0.3, np.random.default_rng(1)), expected)
+
+def test_traces_stop_at_the_bounce():
+    traces, bounce_times = run_universes(8, num_subsystems=3, reset_prob=0.1, max_timesteps=20,
+                                         rng=np.random.default_rng(2))
+    assert any(t is not None for t in bounce_times) and any(t is None for t in bounce_times)
+    for trace, bounce in zip(traces, bounce_times):
+        if bounce is None:
+            assert len(trace) == 20 and trace.min() >= 1e-3
+        else:
+            assert len(trace) == bounce + 1 and trace[-1] < 1e-3 <= trace[:-1].min()
+
+def test_first_step_entropy_and_single_universe_form():
+    trace, bounce = run_universe(num_subsystems=4, reset_prob=0.0, max_timesteps=3, rng=np.random.default_rng(3))
+    assert bounce is None and np.allclose(trace, 4 * eigh_entropy(np.eye(2) / 2))
@@ -0,0 +1,75 @@
+import numpy as np
+
+# Qubit backend: every dim = 2 state is stored as a 3-float Bloch vector r with
+# rho = (I + r . sigma) / 2. Rotations are 3x3 real, resets set r to the |0>
+# pole and entropy comes straight from |r|, so no eigendecompositions are needed.
+# Function names mirror the matrix versions in the simulate_entropy_bounce*,
+# simulate_50_universe_entropy* and urcm_cycle_sim_* scripts. All functions
+# accept a single vector (3,) or a stack (..., 3).
+
+POLE = np.array([0.0, 0.0, 1.0])
+
+def to_bloch(rho):
+    """Bloch vector(s) of 2x2 density matrices, shape (..., 3)."""
+    rho = np.asarray(rho)
+    trace = (rho[..., 0, 0] + rho[..., 1, 1]).real
+    off = rho[..., 1, 0]
+    return np.stack([2 * off.real, 2 * off.imag, (rho[..., 0, 0] - rho[..., 1, 1]).real], axis=-1) / trace[..., None]
+
+def to_density(r):
+    """2x2 density matrices for Bloch vector(s), shape (..., 2, 2)."""
+    r = np.asarray(r)
+    x, y, z = r[..., 0], r[..., 1], r[..., 2]
+    rho = np.stack([np.stack([1 + z, x - 1j * y], axis=-1),
+                    np.stack([x + 1j * y, 1 - z], axis=-1)], axis=-2) / 2
+    return rho.real if not np.any(y) else rho
+
+def generate_initial_state(shape=()):
+    """Maximally mixed state: the centre of the Bloch ball."""
+    shape = (shape,) if np.isscalar(shape) else tuple(shape)
+    return np.zeros(shape + (3,))
+
+def rotation_matrices(theta):
+    """Bloch rotations for U = [[cos, -sin], [sin, cos]]: a turn of 2*theta about y."""
+    c, s = np.cos(2 * theta), np.sin(2 * theta)
+    zero, one = np.zeros_like(c), np.ones_like(c)
+    return np.stack([np.stack([c, zero, s], axis=-1),
+                     np.stack([zero, one, zero], axis=-1),
+                     np.stack([-s, zero, c], axis=-1)], axis=-2)
+
+def unitary_evolve(r, rng=None):
+    """Random real rotation, same angle distribution as the matrix unitary_evolve."""
+    rng = np.random if rng is None else rng
+    r = np.asarray(r, dtype=float)
+    theta = rng.random(r.shape[:-1]) * 2 * np.pi
+    return (rotation_matrices(theta) @ r[..., None])[..., 0]
+
+def entropy_reset(r):
+    """Reset to the pure state |0><0|."""
+    return np.broadcast_to(POLE, np.shape(r)).copy()
+
+def apply_noise(r, gamma, rng=None):
+    """Bloch form of the symmetric Gaussian noise + trace renormalisation of apply_noise."""
+    rng = np.random if rng is None else rng
+    r = np.asarray(r, dtype=float)
+    noise = gamma * rng.standard_normal(r.shape[:-1] + (2, 2))
+    n00, n11 = noise[..., 0, 0], noise[..., 1, 1]
+    n01 = (noise[..., 0, 1] + noise[..., 1, 0]) / 2
+    trace = 1 + n00 + n11
+    shifted = np.stack([r[..., 0] + 2 * n01, r[..., 1], r[..., 2] + n00 - n11], axis=-1)
+    return shifted / trace[..., None]
+
+def von_neumann_entropy(r):
+    """Entropy from the Bloch length: eigenvalues are (1 +- |r|) / 2 (non-positive ones skipped)."""
+    length = np.linalg.norm(r, axis=-1)
+    total = 0.0
+    for vals in ((1 + length) / 2, (1 - length) / 2):
+        positive = vals > 0
+        total = total - np.where(positive, vals * np.log(np.where(positive, vals, 1.0)), 0.0)
+    return total[()] if np.ndim(total) == 0 else total
+
+entropy = von_neumann_entropy
+
+def trace_overlap(r1, r2):
+    """Tr(rho1 rho2), the quantity the urcm_cycle_sim scripts plot as fidelity."""
+    return (1 + np.sum(np.asarray(r1) * np.asarray(r2), axis=-1)) / 2
@@ -0,0 +1,53 @@
+import numpy as np
+import scipy.sparse
+from scipy.sparse.linalg import expm_multiply
+from urcm_metrics import entropy_vn
+
+# Krylov bounce operator. Instead of building the dense unitary exp(-iH) with
+# expm (O(d^3) time, d^2 memory), exp(-iH) is applied to the columns of a
+# low-rank factor F of rho = F F† with scipy.sparse.linalg.expm_multiply.
+# For the pure states the entropy reset produces, F is a single ket and the
+# cost scales with d * nnz(H). Entropy and fidelity of factored states come
+# from k x k products of the factors, never from d x d matrices.
+
+def as_scipy_operator(H):
+    """scipy.sparse (or dense ndarray) view of a Hamiltonian given as Qobj, sparse matrix or array."""
+    if scipy.sparse.issparse(H):
+        return H.tocsr()
+    data = getattr(H, "data", None)
+    if hasattr(data, "as_scipy"):  # QuTiP 5 data layer
+        return data.as_scipy()
+    if scipy.sparse.issparse(data):  # QuTiP 4 fast_csr_matrix
+        return data
+    return np.asarray(H.full() if hasattr(H, "full") else H)
+
+def krylov_bounce(factor, H, phase=1.0):
+    """exp(-i * phase * H) applied to each column of factor (a ket or a (d, k) factor)."""
+    factor = np.asarray(factor.full() if hasattr(factor, "full") else factor)
+    return expm_multiply(-1j * phase * as_scipy_operator(H), factor)
+
+def diagonal_factor(diag):
+    """Factor F with F F† = diag(diag), keeping only the occupied levels as columns."""
+    support = np.flatnonzero(diag)
+    F = np.zeros((len(diag), len(support)))
+    F[support, np.arange(len(support))] = np.sqrt(diag[support])
+    return F
+
+def density_from_factor(F):
+    """Trace-normalised rho = F F†."""
+    F = F.reshape(len(F), -1)
+    return (F @ F.conj().T) / np.vdot(F, F).real
+
+def factor_entropy(F):
+    """Von Neumann entropy of rho = F F† / Tr, from the k x k Gram matrix F† F (same nonzero spectrum)."""
+    F = F.reshape(len(F), -1)
+    return entropy_vn(F.conj().T @ F / np.vdot(F, F).real)
+
+def factor_fidelity(F1, F2):
+    """Tr sqrt(sqrt(rho1) rho2 sqrt(rho1)) (qutip.fidelity convention) for rho_i = F_i F_i† / Tr.
+
+    The trace is the nuclear norm of F1† F2, so only a k1 x k2 SVD is needed.
+    """
+    F1, F2 = F1.reshape(len(F1), -1), F2.reshape(len(F2), -1)
+    overlap = F1.conj().T @ F2
+    return np.sum(np.linalg.svd(overlap, compute_uv=False)) / np.sqrt(np.vdot(F1, F1).real * np.vdot(F2, F2).real)
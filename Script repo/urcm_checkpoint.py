@@ -0,0 +1,99 @@
+import json
+import os
+
+import numpy as np
+
+# Checkpoint / resume for long recursion runs. A checkpoint is a small head
+# .npz (cycle index, RNG bit-generator state, the current state arrays and the
+# number of parts) plus append-only part files <path>.partNNNNN.npz. Each save
+# writes only the rows and metric-log records added since the previous save as
+# a new part, so the cost of a save does not grow with the run; load
+# reassembles the parts in order. Restoring the RNG state makes a resumed run
+# continue bit-exactly. Parts and the head are written through a temporary
+# file, and the head goes last, so an interrupted save leaves the last good
+# checkpoint intact (a stray part beyond the head's count is ignored and
+# overwritten).
+
+LOG_PREFIX = "log/"
+ROWS_PREFIX = "rows/"
+RESERVED = ("checkpoint_cycle", "checkpoint_parts", "rng_state")
+
+def _plain(value):
+    return value.tolist() if isinstance(value, np.ndarray) else value
+
+def rng_state(rng=None):
+    """JSON string of the bit-generator state of a Generator, RandomState or the global np.random."""
+    rng = np.random if rng is None else rng
+    if isinstance(rng, np.random.Generator):
+        state = rng.bit_generator.state
+    else:
+        state = rng.get_state(legacy=False)
+    state = {k: ({kk: _plain(vv) for kk, vv in v.items()} if isinstance(v, dict) else _plain(v)) for k, v in state.items()}
+    return json.dumps(state)
+
+def set_rng_state(state, rng=None):
+    rng = np.random if rng is None else rng
+    state = json.loads(str(state))
+    if "key" in state["state"]:  # MT19937 wants its key as a uint32 array
+        state["state"]["key"] = np.array(state["state"]["key"], dtype=np.uint32)
+    if isinstance(rng, np.random.Generator):
+        rng.bit_generator.state = state
+    else:
+        rng.set_state(state)
+
+def _write(path, contents):
+    tmp = path + ".tmp.npz"
+    np.savez_compressed(tmp, **contents)
+    os.replace(tmp, path)
+
+class Checkpoint:
+    def __init__(self, path, rng=None):
+        self.path = path
+        self.rng = rng
+        self.parts = 0
+
+    def part_path(self, index):
+        return f"{self.path}.part{index:05d}.npz"
+
+    def save(self, cycle, arrays=None, rows=None, log=None):
+        """Persist cycle, RNG state and arrays; append rows ({name: new rows}) and new log records as a part."""
+        arrays = arrays or {}
+        clash = set(arrays) & set(RESERVED)
+        if clash:
+            raise ValueError(f"array names {sorted(clash)} are reserved for checkpoint metadata")
+        part = {ROWS_PREFIX + key: value for key, value in (rows or {}).items()}
+        if log:
+            for key in log[0]:
+                part[LOG_PREFIX + key] = np.array([record[key] for record in log])
+        parts = self.parts
+        if part:
+            _write(self.part_path(parts), part)
+            parts += 1
+        head = {"checkpoint_cycle": np.int64(cycle), "checkpoint_parts": np.int64(parts),
+                "rng_state": np.array(rng_state(self.rng))}
+        head.update(arrays)
+        _write(self.path, head)
+        self.parts = parts
+
+    def load(self):
+        """Restore the RNG state; returns (cycle, arrays, rows, log) with the parts reassembled.
+
+        Later saves append after the loaded parts.
+        """
+        with np.load(self.path) as data:
+            set_rng_state(data["rng_state"], self.rng)
+            arrays = {k: data[k] for k in data.files if k not in RESERVED}
+            cycle = int(data["checkpoint_cycle"])
+            self.parts = int(data["checkpoint_parts"])
+        rows, columns = {}, {}
+        for index in range(self.parts):
+            with np.load(self.part_path(index)) as part:
+                for k in part.files:
+                    if k.startswith(ROWS_PREFIX):
+                        rows.setdefault(k[len(ROWS_PREFIX):], []).append(part[k])
+                    else:
+                        columns.setdefault(k[len(LOG_PREFIX):], []).append(part[k])
+        rows = {k: np.concatenate(chunks) for k, chunks in rows.items()}
+        columns = {k: np.concatenate(chunks).tolist() for k, chunks in columns.items()}
+        log = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        return cycle, arrays, rows, log
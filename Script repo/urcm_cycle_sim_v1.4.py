@@ -12,6 +12,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from urcm_entropy_kernel import entropy
 
 timesteps = 400
 gamma = 0.02
@@ -19,6 +20,7 @@ dim = 2
 dpi = 80
 fps = 10
 entropy_threshold = 1e-3
+use_bloch = False  # True: the qubit as a Bloch vector (urcm_bloch)
 rho = np.eye(dim) / dim
 rho_ref = np.eye(dim) / dim
 
@@ -34,14 +36,14 @@ def apply_noise(rho, gamma):
     rho /= np.trace(rho)
     return rho
 
-def entropy(rho):
-    vals = np.linalg.eigvalsh(rho)
-    vals = vals[vals > 0]
-    return -np.sum(vals * np.log(vals))
-
 def fidelity(r1, r2):
     return np.real(np.trace(r1 @ r2))
 
+if use_bloch:
+    # The maximally mixed state is the origin; fidelity here is Tr(r1 r2), as above
+    from urcm_bloch import apply_noise, entropy, trace_overlap as fidelity
+    rho, rho_ref = np.zeros(3), np.zeros(3)
+
 entropies, fidelities, cycles = [], [], []
 operator_C = np.zeros(timesteps)
 operator_S = np.zeros(timesteps)
@@ -71,7 +73,7 @@ for i, t in enumerate(t_vals):
             stable_cycle = bounce_count
         bounce_count += 1
         last_bounce_frame = i
-        rho = np.eye(dim) / dim
+        rho = rho_ref.copy()
     else:
         rho = apply_noise(rho, gamma)
 
@@ -1,10 +1,12 @@
 # URCM Simulation v1.5 — with top-left cycle and bottom-left footer
 import numpy as np, matplotlib.pyplot as plt, matplotlib.animation as animation
 from datetime import datetime
+from urcm_entropy_kernel import entropy
 
 timesteps, gamma, dim = 400, 0.02, 2
 dpi, fps = 100, 10
 entropy_threshold = 1e-3
+use_bloch = False  # True: track the qubit with urcm_bloch
 rho = np.eye(dim)/dim
 rho_ref = np.eye(dim)/dim
 t_vals = np.linspace(0.5, 2.5, timesteps)
@@ -14,18 +16,19 @@ def apply_noise(r,g):
     n = g*np.random.randn(*r.shape); n=(n+n.T)/2
     r+=n; r=(r+r.T)/2; return r/np.trace(r)
 
-def entropy(r):
-    vals = np.linalg.eigvalsh(r); vals=vals[vals>0]
-    return -(vals*np.log(vals)).sum()
-
 def fidelity(a,b): return np.real(np.trace(a@b))
 
+if use_bloch:
+    # Bloch form: origin = I/2, same noise draws
+    from urcm_bloch import apply_noise, entropy, trace_overlap as fidelity
+    rho, rho_ref = np.zeros(3), np.zeros(3)
+
 E,F = [],[]
 bounce_cnt=0; last_bounce=-50
 for i,t in enumerate(t_vals):
     E.append(entropy(rho));  F.append(fidelity(rho_ref,rho))
     if E[-1]<entropy_threshold and i-last_bounce>40:
-        bounce_cnt+=1; last_bounce=i; rho=np.eye(dim)/dim
+        bounce_cnt+=1; last_bounce=i; rho=rho_ref.copy()
     else: rho = apply_noise(rho,gamma)
 
 fig,ax = plt.subplots(figsize=(6,3))
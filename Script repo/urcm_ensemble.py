@@ -0,0 +1,78 @@
+import numpy as np
+from urcm_entropy_kernel import von_neumann_entropy
+
+# Batched ensemble engine for the apply_noise/entropy loop used by the
+# 50-universe scripts. All universes are held as one (N, d, d) array and
+# stepped together instead of one rho at a time.
+
+def initial_ensemble(num_universes, dim=2):
+    """Maximally mixed starting state for every universe, shape (N, d, d)."""
+    return np.broadcast_to(np.eye(dim) / dim, (num_universes, dim, dim)).copy()
+
+def apply_noise(rhos, gamma=0.0, rng=None):
+    """Symmetric Gaussian noise, Hermitization and trace normalisation for the whole batch."""
+    if gamma > 0.0:
+        rng = np.random if rng is None else rng
+        noise = gamma * rng.standard_normal(rhos.shape)
+        noise = (noise + noise.swapaxes(-1, -2)) / 2  # Hermitian
+        rhos = rhos + noise
+        rhos = (rhos + rhos.swapaxes(-1, -2).conj()) / 2
+        rhos /= np.trace(rhos, axis1=-2, axis2=-1)[..., None, None]
+    return rhos
+
+def entropy(rhos):
+    """Von Neumann entropy of every state in the batch (non-positive eigenvalues skipped)."""
+    return von_neumann_entropy(rhos)
+
+def step_until_bounce(rhos, max_timesteps=500, gamma=0.02, entropy_threshold=1e-3, rng=None):
+    """Masked stepping: bounced universes are frozen and compacted out of the active set.
+
+    Returns the bounce timestep per universe (-1 if none) and the final states,
+    frozen at the bounce step for the universes that bounced.
+    """
+    bounce_times = np.full(len(rhos), -1, dtype=np.int64)
+    final_states = rhos.copy()
+    active = np.arange(len(rhos))
+
+    for t in range(max_timesteps):
+        rhos = apply_noise(rhos, gamma, rng)
+        bounced = entropy(rhos) < entropy_threshold
+        if np.any(bounced):
+            bounce_times[active[bounced]] = t
+            final_states[active[bounced]] = rhos[bounced]
+            rhos, active = rhos[~bounced], active[~bounced]
+            if active.size == 0:
+                break
+
+    final_states[active] = rhos
+    return bounce_times, final_states
+
+def simulate_ensemble(num_universes, max_timesteps=500, gamma=0.02, entropy_threshold=1e-3,
+                      dim=2, chunk_size=100_000, rng=None):
+    """Bounce timestep for each universe, -1 where no bounce happened within max_timesteps."""
+    bounce_times = np.full(num_universes, -1, dtype=np.int64)
+
+    # Chunking caps the (chunk, d, d) working set for 10^6-universe sweeps
+    for start in range(0, num_universes, chunk_size):
+        stop = min(start + chunk_size, num_universes)
+        rhos = initial_ensemble(stop - start, dim)
+        bounce_times[start:stop], _ = step_until_bounce(rhos, max_timesteps, gamma, entropy_threshold, rng)
+
+    return bounce_times
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    num_universes = 100_000
+    max_timesteps = 500
+
+    bounce_times = simulate_ensemble(num_universes, max_timesteps=max_timesteps)
+    bounce_times = np.where(bounce_times < 0, max_timesteps, bounce_times)
+
+    plt.hist(bounce_times, bins=50, edgecolor='black')
+    plt.title(f"Bounce Times with Noise ({num_universes} universes)")
+    plt.xlabel("Timesteps")
+    plt.ylabel("Number of Universes")
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig("bounce_histogram_ensemble.png")
@@ -0,0 +1,97 @@
+import math
+import numpy as np
+
+# Closed-form eigenvalue/entropy kernel for the small Hermitian matrices the
+# simulations step through. At d=2 the LAPACK call overhead of eigvalsh
+# dominates, so the eigenvalues come straight from the trace and determinant.
+# Larger matrices go through one batched np.linalg.eigvalsh call.
+# The bounce check needs no logarithm: a unit-trace qubit with eigenvalues
+# 1/2 ± r has an entropy that falls monotonically in r, so S < threshold is
+# r > r*, with r* solved once per threshold.
+
+TRACE_TOL = 1e-12  # the radius test applies when |Tr rho - 1| is within this
+
+def _eigvalsh_2x2(rhos):
+    # Lower triangle only, same convention as np.linalg.eigvalsh
+    a = rhos[..., 0, 0].real
+    d = rhos[..., 1, 1].real
+    b = rhos[..., 1, 0]
+    half_trace = (a + d) / 2
+    radius = np.hypot((a - d) / 2, np.abs(b))
+    return np.stack([half_trace - radius, half_trace + radius], axis=-1)
+
+def eigvalsh_small(rhos):
+    """Ascending eigenvalues of one or a stack of Hermitian matrices, shape (..., d)."""
+    rhos = np.asarray(rhos)
+    if rhos.shape[-1] == 2:
+        return _eigvalsh_2x2(rhos)
+    return np.linalg.eigvalsh(rhos)
+
+def _entropy_2x2(rho, cutoff, base):
+    # Scalar fast path: plain float maths, no array temporaries
+    (a, _), (b, d) = rho.tolist()
+    if type(a) is complex:
+        a, d = a.real, d.real
+    half_trace = (a + d) / 2
+    radius = math.hypot((a - d) / 2, abs(b))
+    low, high = half_trace - radius, half_trace + radius
+    total = 0.0
+    if low > cutoff:
+        total -= low * math.log(low)
+    if high > cutoff:
+        total -= high * math.log(high)
+    if base is not None:
+        total /= math.log(base)
+    return total
+
+def von_neumann_entropy(rho, cutoff=0.0, base=None):
+    """Von Neumann entropy of one state or a stack of states (eigenvalues <= cutoff skipped)."""
+    if type(rho) is not np.ndarray:
+        rho = np.asarray(rho)
+    if rho.shape == (2, 2):
+        return _entropy_2x2(rho, cutoff, base)
+    vals = eigvalsh_small(rho)
+    positive = vals > cutoff
+    logs = np.log(np.where(positive, vals, 1.0))
+    if base is not None:
+        logs /= np.log(base)
+    return -np.sum(np.where(positive, vals * logs, 0.0), axis=-1)
+
+entropy = von_neumann_entropy
+
+def _binary_entropy(radius):
+    high = 0.5 + radius
+    low = 0.5 - radius
+    return -high * math.log(high) - (low * math.log(low) if low > 0 else 0.0)
+
+def _threshold_radius2(threshold):
+    # r*^2 for the radius r* in [0, 1/2] with entropy(1/2 ± r*) == threshold, by
+    # bisection; None where the entropy is not monotone over the comparison
+    if not 0 < threshold < math.log(2):
+        return None
+    lo, hi = 0.0, 0.5
+    for _ in range(60):
+        mid = (lo + hi) / 2
+        if _binary_entropy(mid) < threshold:
+            hi = mid
+        else:
+            lo = mid
+    return lo * lo
+
+_RADIUS2 = {}  # threshold -> r*^2
+
+def below_threshold(rho, threshold):
+    """Bounce check: True where the entropy has dropped under the threshold."""
+    if type(rho) is not np.ndarray:
+        rho = np.asarray(rho)
+    if rho.shape == (2, 2):
+        if threshold not in _RADIUS2:
+            _RADIUS2[threshold] = _threshold_radius2(threshold)
+        r2 = _RADIUS2[threshold]
+        (a, _), (b, d) = rho.tolist()
+        if type(a) is complex:
+            a, d, b = a.real, d.real, abs(b)
+        if r2 is not None and abs(a + d - 1) <= TRACE_TOL:
+            half_gap = (a - d) / 2
+            return half_gap * half_gap + b * b > r2
+    return von_neumann_entropy(rho) < threshold
@@ -0,0 +1,61 @@
+import numpy as np
+
+# Batch Uhlmann fidelity engine, F = (Tr sqrt(sqrt(rho1) rho2 sqrt(rho1)))^2.
+# Instead of two scipy.linalg.sqrtm calls per pair, sqrt(rho1) comes from one
+# Hermitian eigendecomposition (cacheable when the reference is fixed) and F from
+# the eigenvalues of sqrt(rho1) rho2 sqrt(rho1). Qubits use the closed form
+# Tr(rho sigma) + 2 sqrt(det rho det sigma), generalised below to non-PSD rho2.
+# All functions accept single (d, d) matrices or stacks (N, d, d). As with taking the real part of the
+# sqrtm trace, negative eigenvalues of a noisy rho2 contribute nothing.
+
+DET_TOL = 1e-12  # reference determinants above -DET_TOL count as positive semidefinite
+
+def sqrt_psd(rho):
+    """Matrix square root of Hermitian PSD matrices via eigh (negative rounding clipped)."""
+    vals, vecs = np.linalg.eigh(rho)
+    return (vecs * np.sqrt(np.clip(vals, 0, None))[..., None, :]) @ vecs.conj().swapaxes(-1, -2)
+
+def fidelity_from_sqrt(sqrt_rho1, rho2):
+    """Fidelity given a precomputed sqrt(rho1)."""
+    inner = sqrt_rho1 @ rho2 @ sqrt_rho1
+    vals = np.linalg.eigvalsh(inner)
+    return np.sum(np.sqrt(np.clip(vals, 0, None)), axis=-1) ** 2
+
+def _det2(rho):
+    return (rho[..., 0, 0] * rho[..., 1, 1] - rho[..., 0, 1] * rho[..., 1, 0]).real
+
+def qubit_fidelity(rho1, rho2):
+    """Closed form for 2x2 states; falls back to the eigen path if rho1 is not PSD."""
+    rho1, rho2 = np.broadcast_arrays(np.asarray(rho1), np.asarray(rho2))
+    det1, det2 = _det2(rho1), _det2(rho2)
+    overlap = np.sum(rho1 * rho2.swapaxes(-1, -2), axis=(-2, -1)).real
+    # sqrt(rho1) rho2 sqrt(rho1) has trace Tr(rho1 rho2) and determinant det1 det2,
+    # so its eigenvalues are closed form even when noise leaves rho2 non-PSD
+    det = np.clip(det1, 0, None) * det2
+    disc = np.sqrt(np.clip(overlap ** 2 / 4 - det, 0, None))
+    roots = np.sqrt(np.clip(overlap / 2 + disc, 0, None)) + np.sqrt(np.clip(overlap / 2 - disc, 0, None))
+    F = roots ** 2
+
+    invalid = det1 < -DET_TOL
+    if np.any(invalid):
+        F = np.array(F)
+        F[invalid] = fidelity_from_sqrt(sqrt_psd(rho1[invalid]), rho2[invalid])
+    return F[()] if np.ndim(F) == 0 else F
+
+def fidelity(rho1, rho2):
+    """Uhlmann fidelity of single or stacked state pairs."""
+    rho1, rho2 = np.asarray(rho1), np.asarray(rho2)
+    if rho1.shape[-1] == 2:
+        return qubit_fidelity(rho1, rho2)
+    return fidelity_from_sqrt(sqrt_psd(rho1), rho2)
+
+class FixedReferenceFidelity:
+    def __init__(self, reference):
+        """Fidelity against a fixed reference state (or stack), with sqrt(reference) cached."""
+        self.reference = np.asarray(reference)
+        self.sqrt_reference = sqrt_psd(self.reference)
+
+    def __call__(self, rho):
+        if self.reference.shape[-1] == 2:
+            return qubit_fidelity(self.reference, rho)
+        return fidelity_from_sqrt(self.sqrt_reference, rho)
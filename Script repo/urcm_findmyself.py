@@ -1,10 +1,17 @@
+import argparse
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from urcm_history import RingBuffer
+from urcm_checkpoint import Checkpoint
 
 # === CONFIGURATION ===
 recursions = 25000
 dim = 64
+window = 100  # states kept for the windowed metrics
+metrics_every = 1000  # recursions between metric samples (1 samples every step)
+checkpoint_path = "urcm_findmyself_checkpoint.npz"  # used by --checkpoint without a path
+checkpoint_every = 5000  # recursions between checkpoints
 
 # === URCM Operator Definitions ===
 def bounce_operator(state):
@@ -29,67 +36,107 @@ def recursive_R_operator(state, cycle):
     return fix_operator(state)
 
 # === METRIC DEFINITIONS (VALIDATED) ===
-def metric_operator_fingerprint(states):
-    return np.mean([np.linalg.norm(np.fft.fft(s)) for s in states])
+# Each metric takes a (n, dim) window of consecutive states, oldest first, and
+# reduces it with whole-array operations; window_metrics shares the row norms.
+def _norms(states):
+    return np.linalg.norm(states, axis=1)
+
+def metric_operator_fingerprint(states, norms=None):
+    # Mean ||fft(s)||; by Parseval that is sqrt(dim) * ||s||, so no FFT is needed
+    norms = _norms(states) if norms is None else norms
+    return np.sqrt(states.shape[1]) * np.mean(norms)
 
 def metric_bounce_density_peak(states):
-    return np.max([np.abs(s).max() for s in states])
+    return np.abs(states).max()
 
 def metric_teleology(states):
     final = states[-1]
     return np.sum(np.real(final)**2)
 
 def metric_spectral_entropy_variation(states):
-    data = [np.mean(np.real(s)) for s in states]
+    data = np.mean(np.real(states), axis=1)
     return np.std(np.abs(np.fft.fft(data)))
 
-def metric_recursive_energy_ratio(states):
-    return np.linalg.norm(states[-1]) / (np.linalg.norm(states[0]) + 1e-12)
+def metric_recursive_energy_ratio(states, norms=None):
+    norms = _norms(states) if norms is None else norms
+    return norms[-1] / (norms[0] + 1e-12)
 
 def metric_coherence_persistence(states):
-    return np.mean([np.real(np.vdot(s, states[0])) for s in states])
-
-def metric_bounce_entropy_gradient(states):
-    entropies = [np.linalg.norm(s)**2 for s in states]
-    return np.mean(np.gradient(entropies))
+    # Re <s|s_0> for every row at once
+    return np.mean(np.einsum("ij,j->i", states.conj(), states[0]).real)
+
+def metric_bounce_entropy_gradient(states, norms=None):
+    if len(states) < 2:
+        return 0.0  # np.gradient needs at least two points (recursion 0 has one state)
+    norms = _norms(states) if norms is None else norms
+    return np.mean(np.gradient(norms**2))
+
+def window_metrics(states):
+    """All seven metrics of a (n, dim) window as one record."""
+    states = np.asarray(states)
+    norms = _norms(states)
+    return {
+        "operator_fingerprint": metric_operator_fingerprint(states, norms),
+        "bounce_density_peak": metric_bounce_density_peak(states),
+        "teleology": metric_teleology(states),
+        "spectral_entropy_variation": metric_spectral_entropy_variation(states),
+        "recursive_energy_ratio": metric_recursive_energy_ratio(states, norms),
+        "coherence_persistence": metric_coherence_persistence(states),
+        "bounce_entropy_gradient": metric_bounce_entropy_gradient(states, norms),
+    }
 
 # === SIMULATION ===
-metrics_log = []
-initial_state = np.random.rand(dim) + 1j * np.random.rand(dim)
-initial_state = initial_state / np.linalg.norm(initial_state)
-
-state = initial_state
-state_history = []
-
-for i in range(recursions):
-    state = recursive_R_operator(state, i)
-    state_history.append(state.copy())
-
-    if i % 1000 == 0 or i == recursions - 1:
-        subset = state_history[-100:]
-        metrics_log.append({
-            "recursion": i,
-            "operator_fingerprint": metric_operator_fingerprint(subset),
-            "bounce_density_peak": metric_bounce_density_peak(subset),
-            "teleology": metric_teleology(subset),
-            "spectral_entropy_variation": metric_spectral_entropy_variation(subset),
-            "recursive_energy_ratio": metric_recursive_energy_ratio(subset),
-            "coherence_persistence": metric_coherence_persistence(subset),
-            "bounce_entropy_gradient": metric_bounce_entropy_gradient(subset),
-        })
+def run_simulation(checkpoint_path=None, resume=False):
+    """Run the recursions and return the metrics log (one record per metric sample)."""
+    checkpoint = Checkpoint(checkpoint_path) if checkpoint_path else None
+    state_history = RingBuffer(window, dim)
+    if resume:
+        # Restores np.random too, so the run continues bit-exactly
+        start, saved, _, metrics_log = checkpoint.load()
+        state = saved["state"]
+        for s in saved["history"]:
+            state_history.append(s)
+    else:
+        start, metrics_log = 0, []
+        initial_state = np.random.rand(dim) + 1j * np.random.rand(dim)
+        state = initial_state / np.linalg.norm(initial_state)
+
+    logged = len(metrics_log)  # records already in the checkpoint
+    for i in range(start, recursions):
+        state = recursive_R_operator(state, i)
+        state_history.append(state)
+
+        if i % metrics_every == 0 or i == recursions - 1:
+            metrics_log.append({"recursion": i, **window_metrics(state_history.window())})
+
+        if checkpoint and (i + 1) % checkpoint_every == 0:
+            checkpoint.save(i + 1, {"state": state, "history": state_history.window()}, log=metrics_log[logged:])
+            logged = len(metrics_log)
+    return metrics_log
 
 # === EXPORT ===
-df_metrics = pd.DataFrame(metrics_log)
-df_metrics.to_csv("urcm_metrics_output.csv", index=False)
-
-plt.figure(figsize=(12, 8))
-for metric in df_metrics.columns[1:]:
-    plt.plot(df_metrics['recursion'], df_metrics[metric], label=metric)
-plt.xlabel("Recursion")
-plt.ylabel("Metric Value")
-plt.title("Validated URCM Metrics Over Recursive Cycles")
-plt.legend(loc='upper right')
-plt.grid(True)
-plt.tight_layout()
-plt.savefig("urcm_metrics_plot.png", dpi=300)
-plt.close()
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--checkpoint", nargs="?", const=checkpoint_path, help="save progress to this .npz")
+    parser.add_argument("--resume", action="store_true", help="continue from --checkpoint")
+    args = parser.parse_args()
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint")
+
+    df_metrics = pd.DataFrame(run_simulation(args.checkpoint, args.resume))
+    df_metrics.to_csv("urcm_metrics_output.csv", index=False)
+
+    plt.figure(figsize=(12, 8))
+    for metric in df_metrics.columns[1:]:
+        plt.plot(df_metrics['recursion'], df_metrics[metric], label=metric)
+    plt.xlabel("Recursion")
+    plt.ylabel("Metric Value")
+    plt.title("Validated URCM Metrics Over Recursive Cycles")
+    plt.legend(loc='upper right')
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig("urcm_metrics_plot.png", dpi=300)
+    plt.close()
+
+if __name__ == "__main__":
+    main()
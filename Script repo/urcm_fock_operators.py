@@ -0,0 +1,72 @@
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+
+# Structured operator backend for the Fock-space R = B ∘ S ∘ C cycle in
+# urcm_infinite_hilbert_simulation.py. The compression and entropy reset
+# operators are diagonal in the Fock basis, so they are held as weight vectors,
+# built once per run and applied as elementwise scalings of rho. Only the bounce
+# operator needs dense work. States are plain ndarrays: a (d, d) density matrix,
+# or a length-d vector for diagonal states / populations. The reset only reads
+# populations, so C followed by S may be applied to diag(rho) alone.
+# As with Qobj.unit() on these positive operators, every step renormalises by the trace.
+
+def compression_weights(d, modes):
+    """Diagonal of sum_i fock_dm(d, i) / (modes // 2) for i < modes // 2."""
+    p = np.zeros(d)
+    p[:modes // 2] = 1 / (modes // 2)
+    return p
+
+def reset_weights(d, sigma, modes, num_lambdas=100):
+    """Collapsed Kraus weights: sum of f(lambda) over the Gaussian Kraus ops landing on each Fock level."""
+    lambdas = np.linspace(-1, 1, num_lambdas)
+    f_lambda = np.exp(-lambdas**2 / (2 * sigma**2)) / np.sqrt(2 * np.pi * sigma**2)
+    f_lambda /= np.sum(f_lambda)  # Normalize
+    levels = (modes * (lambdas + 1) / 2).astype(int)
+    return np.bincount(levels, weights=f_lambda, minlength=d)[:d]
+
+def apply_compression(rho, p):
+    """C: (P rho P†) / Tr with P = diag(p), i.e. rho_ij * p_i * p_j (populations only for a vector)."""
+    if rho.ndim == 1:
+        rho_out = rho * np.abs(p) ** 2
+        return rho_out / rho_out.sum().real
+    rho_out = rho * np.outer(p, p.conj())
+    return rho_out / np.trace(rho_out).real
+
+def apply_reset(rho, w):
+    """S: sum_k K_k rho K_k† with diagonal Kraus ops; returns the diagonal state as a vector."""
+    diag = w * (rho if rho.ndim == 1 else np.diagonal(rho)).real
+    return diag / diag.sum()
+
+def apply_noise(diag, strength):
+    """Depolarizing noise on a diagonal state (no renormalisation, as in the script)."""
+    return (1 - strength) * diag + strength / len(diag)
+
+def bounce_unitary(H, cycle, theta_60=2 * np.pi / 60):
+    """Dense exp(-i H e^{i theta_60 cycle}) for the bounce operator."""
+    if scipy.sparse.issparse(H):
+        H = H.toarray()
+    H = H.full() if hasattr(H, "full") else np.asarray(H)
+    phase = np.exp(1j * theta_60 * cycle)  # 60-fold symmetry (Ashtekar et al., 2006)
+    return scipy.linalg.expm(-1j * H * phase)
+
+def bounce_factor(diag, spectrum, cycle, theta_60=2 * np.pi / 60):
+    """B on a diagonal state from the eigendecomposition (vals, vecs) of H, as a unit-norm factor F.
+
+    rho_out = F F† with F = exp(-i H e^{i theta_60 cycle}) sqrt(diag) on the occupied
+    levels; the d x d exponential is never formed.
+    """
+    vals, vecs = spectrum
+    phase = np.exp(1j * theta_60 * cycle)  # 60-fold symmetry (Ashtekar et al., 2006)
+    exponent = -1j * phase * vals
+    exponent -= exponent.real.max()  # the complex phase makes B non-unitary; the scale cancels below
+    support = np.flatnonzero(diag)
+    F = (vecs * np.exp(exponent)) @ (vecs[support].conj().T * np.sqrt(diag[support]))
+    return F / np.linalg.norm(F)
+
+def apply_bounce(diag, U):
+    """B on a diagonal state: U diag(r) U† over the occupied levels only, trace normalised."""
+    support = np.flatnonzero(diag)
+    U_support = U[:, support]
+    rho_out = (U_support * diag[support]) @ U_support.conj().T
+    return rho_out / np.trace(rho_out).real
@@ -0,0 +1,34 @@
+import numpy as np
+
+# Fixed-capacity ring buffer for state histories. Only the last W states are
+# kept, in a preallocated (2W, dim) array where every state is written twice
+# (at slot i and i + W). The last n states are then always one contiguous slice,
+# so window() is a zero-copy view in chronological order and memory stays
+# constant however many recursions are run.
+
+class RingBuffer:
+    def __init__(self, capacity, dim, dtype=complex):
+        self.capacity = capacity
+        self._data = np.zeros((2 * capacity, dim), dtype=dtype)
+        self._next = 0   # slot the next state goes into
+        self._count = 0  # states held, at most capacity
+
+    def __len__(self):
+        return self._count
+
+    def append(self, state):
+        self._data[self._next] = state
+        self._data[self._next + self.capacity] = state
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def window(self, n=None):
+        """Read-only (n, dim) view of the last n states, oldest first (all held states by default)."""
+        n = self._count if n is None else min(n, self._count)
+        end = self._next + self.capacity
+        view = self._data[end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def latest(self):
+        return self.window(1)[0]
@@ -1,6 +1,11 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from qutip import *
+from urcm_fock_operators import (compression_weights, reset_weights, apply_compression, apply_reset,
+                                 apply_noise as apply_diagonal_noise, bounce_factor)
+from urcm_metrics import l1_coherence
+from urcm_operator_factory import OperatorFactory
+from urcm_bounce import krylov_bounce, diagonal_factor, density_from_factor, factor_entropy, factor_fidelity
 
 # Parameters
 d = 1000  # Fock space dimension (truncated)
@@ -8,75 +13,95 @@ modes = 100  # Number of Fock modes
 cycles = 50  # Number of cycles
 noise_levels = [0.0, 0.05]  # Noise strengths
 sigma = 0.1  # Gaussian width for entropy reset
+krylov_max_rank = 100  # bounce via expm_multiply when rho has at most this many occupied levels
+seed = 0  # bounce Hamiltonians are keyed on (d, seed, cycle) and shared by every noise level
 lambda_decay = 0.1  # Decay parameter, derived as -ln(rho_spec(R - I)) (Nielsen & Chuang, 2010)
 
-# Initial state: mixed state in Fock space
+# States are carried as a trace-normalised factor F, rho = F F† (d x k): the
+# bounce acts on the occupied levels of the reset state, so k is at most the
+# number of those levels (all d once noise is added). The reset only reads
+# populations, entropy and fidelity come from k x k products of the factors
+# (urcm_bounce), and only the l1 coherence forms the dense rho. Noise-free
+# states keep at most modes // 2 occupied levels and are bounced with the
+# Krylov action on those columns; full-rank noisy states use the
+# eigendecomposition of the cycle's Hamiltonian, computed once per cycle, so
+# the noise levels advance together cycle by cycle.
+
+# Initial state: mixed state in Fock space, as the factor of sum(ket2dm(psi)) / 10
 def generate_initial_state(d, modes):
     psi_list = [fock(d, np.random.randint(0, modes)) for _ in range(10)]
-    rho = sum([ket2dm(psi) for psi in psi_list]) / 10
-    return rho.unit()
+    return np.hstack([psi.full() for psi in psi_list]) / np.sqrt(10)
+
+# C and S are diagonal in the Fock basis: their weights are built once per run
+# and applied as elementwise scalings (see urcm_fock_operators)
+compression_p = compression_weights(d, modes)
+reset_w = reset_weights(d, sigma, modes)
 
-# Compression operator: project to low-energy subspace
-def compression_operator(rho, modes):
-    proj = sum([fock_dm(d, i) for i in range(modes // 2)]) / (modes // 2)
-    return (proj * rho * proj.dag()).unit()
+# Sparse bounce Hamiltonians are built once per cycle, one cycle ahead on a
+# background thread; the spectrum only when a noisy (full-rank) state needs it
+operators = OperatorFactory(d, seed, density=0.1, maxsize=4)
+bounce_kind = "spectrum" if any(epsilon > 0 for epsilon in noise_levels) else "hamiltonian"
+operators.prefetch(bounce_kind, [0])
+
+# Compression operator: project to low-energy subspace. C and S are diagonal and
+# S only reads populations, so C acts on diag(rho) = sum_k |F_ik|^2
+def compression_operator(F):
+    return apply_compression(np.sum(np.abs(F) ** 2, axis=1), compression_p)
 
 # Entropy reset operator: continuous Kraus representation
-def entropy_reset_operator(rho, sigma, modes):
+def entropy_reset_operator(rho):
     """
     Entropy reset operator (S) using a continuous Kraus representation for infinite-dimensional
     Fock spaces. Projects to low-entropy subspace with Gaussian-weighted Kraus operators.
     Converges to a low-entropy state if spectral radius of non-unitary part < 1 (Nielsen & Chuang, 2010).
+    The Kraus operators are Fock projectors, so the output is diagonal and returned as a vector.
     """
-    lambdas = np.linspace(-1, 1, 100)
-    f_lambda = np.exp(-lambdas**2 / (2 * sigma**2)) / np.sqrt(2 * np.pi * sigma**2)
-    f_lambda /= np.sum(f_lambda)  # Normalize
-    kraus_ops = [np.sqrt(f_lambda[i]) * fock_dm(d, int(modes * (lambdas[i] + 1) / 2)) for i in range(len(lambdas))]
-    rho_out = sum([K * rho * K.dag() for K in kraus_ops])
-    return rho_out.unit()
+    return apply_reset(rho, reset_w)
 
 # Bounce operator: unitary evolution with LQC-inspired Hamiltonian and 60-fold symmetry
-def bounce_operator(rho, cycle, theta_60=2 * np.pi / 60):
-    H = rand_herm(d, density=0.1)
-    phase = np.exp(1j * theta_60 * cycle)  # 60-fold symmetry (Ashtekar et al., 2006)
-    U = (-1j * H * phase).expm()
-    return (U * rho * U.dag()).unit()
+def bounce_operator(rho_diag, cycle, theta_60=2 * np.pi / 60):
+    if np.count_nonzero(rho_diag) <= krylov_max_rank:
+        # Low-rank state: evolve the occupied columns only, cost ~ rank * nnz(H)
+        phase = np.exp(1j * theta_60 * cycle)  # 60-fold symmetry (Ashtekar et al., 2006)
+        F = krylov_bounce(diagonal_factor(rho_diag), operators.get("hamiltonian", cycle), phase)
+        return F / np.linalg.norm(F)
+    return bounce_factor(rho_diag, operators.get("spectrum", cycle), cycle, theta_60)
 
 # Depolarizing noise
-def apply_noise(rho, strength):
-    identity = qeye(d)
-    return (1 - strength) * rho + strength * (identity / d)
+def apply_noise(rho_diag, strength):
+    return apply_diagonal_noise(rho_diag, strength)
 
 # Simulation
 results = {}
+rho_current, rho_prev = {}, {}
 for epsilon in noise_levels:
-    rho_current = generate_initial_state(d, modes)
-    rho_prev = rho_current
-    entropy_vals = []
-    fidelity_vals = []
-    coherence_vals = []
-    
-    for n in range(cycles):
-        alpha = np.exp(-lambda_decay * n)  # Cycle-dependent decay
-        beta = np.exp(-lambda_decay * n)
-        gamma = np.exp(-lambda_decay * n)
-        
+    rho_current[epsilon] = rho_prev[epsilon] = generate_initial_state(d, modes)
+    results[epsilon] = {"entropy": [], "fidelity": [], "coherence": []}
+
+for n in range(cycles):
+    alpha = np.exp(-lambda_decay * n)  # Cycle-dependent decay
+    beta = np.exp(-lambda_decay * n)
+    gamma = np.exp(-lambda_decay * n)
+    if n + 1 < cycles:
+        operators.prefetch(bounce_kind, [n + 1])
+
+    for epsilon in noise_levels:
         # Operator sequence: R = B ∘ S ∘ C
-        rho_boundary = compression_operator(rho_current, modes)
-        rho_purified = entropy_reset_operator(rho_boundary, sigma, modes)
+        rho_boundary = compression_operator(rho_current[epsilon])
+        rho_purified = entropy_reset_operator(rho_boundary)
         rho_noisy = apply_noise(rho_purified, epsilon) if epsilon > 0 else rho_purified
         rho_next = bounce_operator(rho_noisy, n)
         
-        # Metrics
-        entropy_vals.append(entropy_vn(rho_next))
-        fidelity_vals.append(fidelity(rho_prev, rho_next))
-        coherence = sum(abs(rho_next[i, j]) for i in range(d) for j in range(d) if i != j)
-        coherence_vals.append(coherence)
+        # Metrics (qutip.entropy_vn / qutip.fidelity conventions)
+        data = results[epsilon]
+        data["entropy"].append(factor_entropy(rho_next))
+        data["fidelity"].append(factor_fidelity(rho_prev[epsilon], rho_next))
+        data["coherence"].append(l1_coherence(density_from_factor(rho_next)))
         
-        rho_prev = rho_current
-        rho_current = rho_next
-    
-    results[epsilon] = {"entropy": entropy_vals, "fidelity": fidelity_vals, "coherence": coherence_vals}
+        rho_prev[epsilon] = rho_current[epsilon]
+        rho_current[epsilon] = rho_next
+
+operators.close()
 
 # Plot results
 # Expected Results:
@@ -0,0 +1,140 @@
+import numpy as np
+import scipy.linalg
+from scipy.sparse.linalg import LinearOperator, eigsh
+from urcm_bounce import krylov_bounce
+from urcm_reset import extremal_eigenvector
+
+# Factored state type for the R = B ∘ S ∘ C cycle:
+#     rho = p0 * I/d + V diag(w) V†,   V (d, k) with orthonormal columns.
+# After the entropy reset the state is rank-1, the bounce is unitary and the
+# depolarizing noise only moves weight into p0, so the cycle never needs a
+# dense d x d state. The compression is kept lazy (P rho P† is only ever applied
+# to vectors) and the reset reads its eigenvector off that operator. Entropy and
+# fidelity are computed from the small k x k factor.
+
+DENSE_MAX_DIM = 256  # below this the reset just diagonalises the dense d x d matrix
+
+def _orthonormalise(V, w, tol=1e-14):
+    # Rewrite V diag(w) V† with orthonormal columns, dropping negligible weights
+    Q, R = np.linalg.qr(V * np.sqrt(w))
+    vals, vecs = np.linalg.eigh(R @ R.conj().T)
+    keep = vals > tol * max(vals.max(initial=0.0), tol)
+    return Q @ vecs[:, keep], vals[keep]
+
+class LowRankState:
+    def __init__(self, V, w, p0=0.0):
+        V = np.asarray(V, dtype=complex).reshape(len(V), -1)
+        self.d = V.shape[0]
+        self.V, self.w = _orthonormalise(V, np.asarray(w, dtype=float))
+        self.p0 = float(p0)
+
+    @classmethod
+    def from_kets(cls, kets, weights=None):
+        """Mixture of kets (arrays or Qobj), equally weighted by default."""
+        cols = [np.ravel(k.full() if hasattr(k, "full") else k) for k in kets]
+        w = np.full(len(cols), 1 / len(cols)) if weights is None else np.asarray(weights, dtype=float)
+        return cls(np.stack(cols, axis=1), w)
+
+    @classmethod
+    def pure(cls, psi):
+        psi = np.ravel(psi.full() if hasattr(psi, "full") else psi)
+        return cls(psi / np.linalg.norm(psi), [1.0])
+
+    @property
+    def rank(self):
+        return len(self.w)
+
+    def eigenvalues(self):
+        """Nonzero-factor eigenvalues and the flat p0/d level with its multiplicity."""
+        return self.w + self.p0 / self.d, self.p0 / self.d, self.d - self.rank
+
+    def matvec(self, x):
+        coeffs = (self.w * (self.V.conj().T @ x).T).T
+        return self.p0 / self.d * x + self.V @ coeffs
+
+    def to_dense(self):
+        return self.p0 / self.d * np.eye(self.d) + (self.V * self.w) @ self.V.conj().T
+
+    def entropy(self):
+        """Von Neumann entropy (natural log)."""
+        vals, flat, multiplicity = self.eigenvalues()
+        vals = vals[vals > 0]
+        S = -np.sum(vals * np.log(vals))
+        if flat > 0:
+            S -= multiplicity * flat * np.log(flat)
+        return S
+
+    def depolarize(self, strength):
+        """(1 - s) rho + s I/d."""
+        return LowRankState(self.V, (1 - strength) * self.w, (1 - strength) * self.p0 + strength)
+
+    def evolve(self, U):
+        """U rho U† for a unitary U (the I/d part is invariant)."""
+        return LowRankState(U @ self.V, self.w, self.p0)
+
+    def bounce(self, H, phase=1.0):
+        """exp(-i phase H) applied to the k factor columns via Krylov expm_multiply."""
+        return LowRankState(krylov_bounce(self.V, H, phase), self.w, self.p0)
+
+    def compress(self, P):
+        """Lazy C: P rho P† (P an array or Qobj), normalised when made dense."""
+        return CompressedState(P, self)
+
+class CompressedState:
+    def __init__(self, P, state):
+        self.P = np.asarray(P.full() if hasattr(P, "full") else P)
+        self.state = state
+
+    def matvec(self, x):
+        return self.P @ self.state.matvec(self.P.conj().T @ x)
+
+    def to_dense(self):
+        rho = self.P @ self.state.to_dense() @ self.P.conj().T
+        return rho / np.trace(rho).real
+
+    def reset(self, which="lowest", v0=None):
+        """S: pure state on the lowest (or dominant) eigenvector of P rho P†, optionally warm-started."""
+        d = self.state.d
+        if d <= DENSE_MAX_DIM:
+            vals, vecs = np.linalg.eigh(self.to_dense())
+            psi = vecs[:, 0] if which == "lowest" else vecs[:, -1]
+        elif which == "dominant":
+            op = LinearOperator((d, d), matvec=self.matvec, dtype=complex)
+            psi = extremal_eigenvector(op, "dominant", v0=v0)
+        elif self.state.p0 == 0:
+            # P rho P† is singular: any vector orthogonal to P V is a lowest (zero) eigenvector
+            Q = np.linalg.qr(self.P @ self.state.V)[0]
+            j = np.argmin(np.sum(np.abs(Q) ** 2, axis=1))
+            psi = -Q @ Q[j].conj()
+            psi[j] += 1
+        else:
+            # The smallest eigenvalues cluster near zero, so iterate on the inverse
+            # P^-† rho^-1 P^-1 instead, with rho^-1 from the factor (Woodbury)
+            lu = scipy.linalg.lu_factor(self.P)
+            flat = self.state.p0 / d
+            V, w = self.state.V, self.state.w
+
+            def inverse_matvec(x):
+                y = scipy.linalg.lu_solve(lu, x)
+                y = (y - V @ ((w / (w + flat)) * (V.conj().T @ y).T).T) / flat
+                return scipy.linalg.lu_solve(lu, y, trans=2)
+
+            op = LinearOperator((d, d), matvec=inverse_matvec, dtype=complex)
+            psi = eigsh(op, k=1, which="LA", v0=v0)[1][:, 0]
+        return LowRankState.pure(psi)
+
+def fidelity(a, b):
+    """Tr sqrt(sqrt(a) b sqrt(a)) (qutip.fidelity convention) from the joint factor span."""
+    d = a.d
+    Q = np.linalg.qr(np.hstack([a.V, b.V]))[0]
+    m = Q.shape[1]
+
+    def block(s):
+        Vq = Q.conj().T @ s.V
+        return s.p0 / d * np.eye(m) + (Vq * s.w) @ Vq.conj().T
+
+    vals, vecs = np.linalg.eigh(block(a))
+    sqrt_a = (vecs * np.sqrt(np.clip(vals, 0, None))) @ vecs.conj().T
+    inner = np.linalg.eigvalsh(sqrt_a @ block(b) @ sqrt_a)
+    # Outside the joint span both states are flat, contributing sqrt(p0_a p0_b)/d per dimension
+    return np.sum(np.sqrt(np.clip(inner, 0, None))) + (d - m) * np.sqrt(a.p0 * b.p0) / d
@@ -0,0 +1,88 @@
+import numpy as np
+import scipy.sparse
+from urcm_entropy_kernel import von_neumann_entropy
+
+# Reusable state metrics computed as vectorised NumPy / SciPy sparse reductions.
+# Inputs may be ndarrays, scipy.sparse matrices or QuTiP Qobj (anything with .full()).
+# Pure-state vectors (1-D arrays, (d, 1) columns or Qobj kets) get purity, basis
+# entropy and participation ratio from |psi|^2 in O(d); density matrices fall
+# back to the matrix forms. The ket_* functions reduce over the last axis, so
+# they also take (U, d) batches of state vectors.
+
+def _as_array(rho):
+    if scipy.sparse.issparse(rho):
+        return rho
+    return rho.full() if hasattr(rho, "full") else np.asarray(rho)
+
+def _is_ket(state):
+    if hasattr(state, "isket"):
+        return state.isket
+    return len(state.shape) == 1 or state.shape[1] == 1
+
+def _ket_array(state):
+    state = _as_array(state)
+    return np.ravel(state.toarray() if scipy.sparse.issparse(state) else state)
+
+def shannon_entropy(p):
+    """-sum p log p over the positive entries of a probability vector."""
+    p = np.asarray(p).real
+    positive = p > 0
+    return -np.sum(p[positive] * np.log(p[positive]))
+
+def entropy_vn(rho):
+    """Von Neumann entropy (natural log), matching qutip.entropy_vn."""
+    rho = _as_array(rho)
+    if scipy.sparse.issparse(rho):
+        rho = rho.toarray()
+    return von_neumann_entropy(rho)
+
+def l1_coherence(rho):
+    """l1-norm of coherence: sum of |rho_ij| over i != j."""
+    rho = _as_array(rho)
+    if scipy.sparse.issparse(rho):
+        return abs(rho).sum() - np.abs(rho.diagonal()).sum()
+    return np.abs(rho).sum() - np.abs(np.diagonal(rho)).sum()
+
+def relative_entropy_coherence(rho):
+    """Relative entropy of coherence: S(diag(rho)) - S(rho)."""
+    rho = _as_array(rho)
+    return shannon_entropy(rho.diagonal()) - entropy_vn(rho)
+
+def ket_probabilities(psi):
+    return np.abs(psi) ** 2
+
+def ket_purity(psi):
+    """Tr(rho^2) of |psi><psi|, i.e. ||psi||^4."""
+    return np.sum(ket_probabilities(psi), axis=-1) ** 2
+
+def ket_entropy(psi, base=2):
+    """Shannon entropy of |psi|^2 (bits by default)."""
+    p = ket_probabilities(psi)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(p > 0, p * np.log(p), 0.0)
+    return -np.sum(terms, axis=-1) / np.log(base)
+
+def ket_participation_ratio(psi):
+    return 1.0 / np.sum(ket_probabilities(psi) ** 2, axis=-1)
+
+def purity(state):
+    """Tr(rho^2); O(d) for state vectors, sum of |rho_ij|^2 for a Hermitian rho."""
+    if _is_ket(state):
+        return ket_purity(_ket_array(state))
+    rho = _as_array(state)
+    if scipy.sparse.issparse(rho):
+        return abs(rho).power(2).sum()
+    return np.sum(np.abs(rho) ** 2)
+
+def basis_entropy(state, base=2):
+    """Shannon entropy of the basis populations: |psi|^2 for kets, diag(rho) otherwise."""
+    if _is_ket(state):
+        return ket_entropy(_ket_array(state), base)
+    return shannon_entropy(_as_array(state).diagonal()) / np.log(base)
+
+def participation_ratio(state):
+    """1 / sum p_i^2 over the basis populations."""
+    if _is_ket(state):
+        return ket_participation_ratio(_ket_array(state))
+    p = _as_array(state).diagonal().real
+    return 1.0 / np.sum(p ** 2)
@@ -0,0 +1,114 @@
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+
+# Cached, seeded random-operator factory. Every draw is keyed on
+# (d, seed, cycle, kind): its RNG stream is derived from those values alone, so
+# the same key always gives the same operator regardless of call order, and
+# sweeps over noise levels reuse identical operator draws. Operators are built
+# lazily, held in an LRU cache and can be pre-generated in a background thread.
+
+def _projector(factory, cycle):
+    # Same distribution as np.random.rand(d, d); the scale cancels in .unit()
+    return factory.rng("projector", cycle).random((factory.d, factory.d))
+
+def _ket(factory, cycle):
+    rng = factory.rng("ket", cycle)
+    psi = rng.standard_normal(factory.d) + 1j * rng.standard_normal(factory.d)
+    return psi / np.linalg.norm(psi)
+
+def _hamiltonian(factory, cycle):
+    # Uniform complex entries in (-1, 1) on a random fraction `density` of sites, then Hermitised
+    rng = factory.rng("hamiltonian", cycle)
+    d = factory.d
+    H = (2 * rng.random((d, d)) - 1) + 1j * (2 * rng.random((d, d)) - 1)
+    H = (H + H.conj().T) / 2
+    if factory.density < 1:
+        mask = np.triu(rng.random((d, d)) < factory.density)
+        H *= mask | mask.T
+    return scipy.sparse.csr_matrix(H) if factory.density < 1 else H
+
+def _unitary(factory, cycle):
+    H = factory.get("hamiltonian", cycle)
+    H = H.toarray() if scipy.sparse.issparse(H) else H
+    return scipy.linalg.expm(-1j * H)
+
+def _spectrum(factory, cycle):
+    # (eigenvalues, eigenvectors) of the Hamiltonian: exp(-i t H) for any complex t is then two matmuls
+    H = factory.get("hamiltonian", cycle)
+    return np.linalg.eigh(H.toarray() if scipy.sparse.issparse(H) else H)
+
+class OperatorFactory:
+    def __init__(self, d, seed=0, density=0.75, maxsize=128):
+        self.d = d
+        self.seed = seed
+        self.density = density
+        self.maxsize = maxsize
+        self.builders = {"projector": _projector, "ket": _ket, "hamiltonian": _hamiltonian, "unitary": _unitary,
+                         "spectrum": _spectrum}
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._worker = threading.local()  # marks the prefetch thread
+
+    def rng(self, kind, cycle):
+        """Generator for one (kind, cycle) draw; crc32 keeps the kind key stable across processes."""
+        return np.random.default_rng([self.seed, self.d, cycle, zlib.crc32(kind.encode())])
+
+    def register(self, kind, builder):
+        """Add an operator kind built by builder(factory, cycle)."""
+        self.builders[kind] = builder
+
+    def get(self, kind, cycle):
+        key = (kind, cycle)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            future = self._pending.get(key)
+        # The prefetch thread must not wait on its own queue (e.g. a unitary
+        # needing a queued Hamiltonian), so there it builds dependencies inline
+        if future is not None and not getattr(self._worker, "active", False):
+            return future.result()
+        value = self.builders[kind](self, cycle)
+        self._store(key, value)
+        return value
+
+    def prefetch(self, kind, cycles):
+        """Queue (kind, cycle) draws on a background thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        for cycle in cycles:
+            key = (kind, cycle)
+            with self._lock:
+                if key in self._cache or key in self._pending:
+                    continue
+                self._pending[key] = self._executor.submit(self._build_pending, key)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _build_pending(self, key):
+        self._worker.active = True
+        try:
+            value = self.builders[key[0]](self, key[1])
+            self._store(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def _store(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
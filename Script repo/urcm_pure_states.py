@@ -0,0 +1,43 @@
+import numpy as np
+from urcm_metrics import ket_entropy, ket_participation_ratio, ket_probabilities, ket_purity
+
+# Vectorised pure-state recursion engine for the R / projection / bounce /
+# temporal operator scripts. All universes live in one (U, dim) complex array
+# (one row per universe) and every operator acts on the whole batch. Noise is
+# drawn as one (U, 2, dim) block, real part then imaginary part per universe,
+# which is the same order as the per-universe loops consumed np.random.
+
+def random_states(num_universes, dim, rng=None):
+    """Normalised rand(dim) + 1j*rand(dim) for every universe."""
+    rng = np.random if rng is None else rng
+    z = rng.random((num_universes, 2, dim))
+    return normalise(z[:, 0] + 1j * z[:, 1])
+
+def normalise(states):
+    """Unit-norm rows; all-zero rows are left unchanged."""
+    norms = np.linalg.norm(states, axis=1, keepdims=True)
+    return states / np.where(norms != 0, norms, 1)
+
+def add_noise(states, strength, rng=None):
+    """Complex Gaussian noise with standard deviation strength on each component."""
+    rng = np.random if rng is None else rng
+    z = rng.normal(0, strength, (len(states), 2, states.shape[1]))
+    return states + z[:, 0] + 1j * z[:, 1]
+
+def decohere(states, strength, rng=None):
+    return normalise(add_noise(states, strength, rng))
+
+def project_argmax(states, where=None):
+    """Collapse each row (or the rows selected by the boolean mask where) onto its most probable basis state."""
+    projected = states.copy() if where is not None else np.zeros_like(states)
+    rows = np.arange(len(states)) if where is None else np.flatnonzero(where)
+    idx = np.argmax(np.abs(states[rows]) ** 2, axis=1)
+    projected[rows] = 0
+    projected[rows, idx] = 1.0
+    return projected
+
+# Metrics come from the O(dim) pure-state forms in urcm_metrics, one value per row
+probabilities = ket_probabilities
+entropy = ket_entropy
+purity = ket_purity
+participation_ratio = ket_participation_ratio
@@ -1,10 +1,13 @@
 import numpy as np
 from qutip import *
+from urcm_bounce import krylov_bounce
+from urcm_reset import extremal_eigenvector
 import pandas as pd
 
 # Parameters
 d = 5  # Hilbert space dimension
 cycles = 3  # Number of cycles
+reset_mode = "lowest"  # eigvecs[0] as before; "dominant" follows the operator comment
 
 # Initial high-entropy state (random mixed state)
 def generate_high_entropy_state(d):
@@ -18,17 +21,18 @@ def compression_operator(rho):
     proj = proj.unit()
     return (proj * rho * proj.dag()).unit()
 
-# Entropy reset operator: simulate purification to dominant eigenstate
+# Entropy reset operator: simulate purification to dominant eigenstate (kept as a ket)
+# d = 5 is far below urcm_reset.DENSE_MAX_DIM, so only the chosen eigenpair comes from LAPACK eigh
 def entropy_reset_operator(rho):
-    eigvals, eigvecs = rho.eigenstates()
-    purified = eigvecs[0] * eigvecs[0].dag()  # dominant eigenvector
-    return purified.unit()
+    psi = Qobj(extremal_eigenvector(rho, reset_mode), dims=[rho.dims[0], [1]])
+    return psi.unit()
 
-# Bounce operator: simulate with unitary evolution
-def bounce_operator(rho):
+# Bounce operator: simulate with unitary evolution, applied to the pure
+# reset state via Krylov expm_multiply instead of a dense expm
+def bounce_operator(psi):
     H = rand_herm(d)
-    U = (-1j * H).expm()
-    return (U * rho * U.dag()).unit()
+    psi_out = Qobj(krylov_bounce(psi, H), dims=psi.dims).unit()
+    return ket2dm(psi_out)
 
 # Simulation loop
 entropy_vals = []
@@ -0,0 +1,61 @@
+import numpy as np
+
+# Ragged entropy-trace store. Variable-length traces are packed into one flat
+# values array plus an offsets array (trace i is values[offsets[i]:offsets[i+1]]),
+# written as two plain .npy files so they load without pickle and can be
+# memory-mapped with mmap_mode='r'.
+
+VALUES_SUFFIX = ".values.npy"
+OFFSETS_SUFFIX = ".offsets.npy"
+
+def _stem(path):
+    for suffix in (VALUES_SUFFIX, OFFSETS_SUFFIX, ".npy"):
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+class RaggedTraces:
+    def __init__(self, values, offsets):
+        self.values = values
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        """Universe i's trace as a zero-copy view into values."""
+        if i < 0:
+            i += len(self)
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def lengths(self):
+        return np.diff(self.offsets)
+
+def pack_traces(traces, dtype=np.float64):
+    """Flatten a list of traces into a RaggedTraces held in memory."""
+    offsets = np.zeros(len(traces) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(trace) for trace in traces])
+    values = np.empty(offsets[-1], dtype=dtype)
+    for i, trace in enumerate(traces):
+        values[offsets[i]:offsets[i + 1]] = trace
+    return RaggedTraces(values, offsets)
+
+def save_traces(path, traces, dtype=np.float64):
+    """Write traces as <stem>.values.npy and <stem>.offsets.npy, returning the stem."""
+    if not isinstance(traces, RaggedTraces):
+        traces = pack_traces(traces, dtype)
+    stem = _stem(path)
+    np.save(stem + VALUES_SUFFIX, traces.values)
+    np.save(stem + OFFSETS_SUFFIX, traces.offsets)
+    return stem
+
+def load_traces(path, mmap_mode='r'):
+    """Open a saved trace store; with mmap_mode='r' nothing is read until a trace is accessed."""
+    stem = _stem(path)
+    values = np.load(stem + VALUES_SUFFIX, mmap_mode=mmap_mode)
+    offsets = np.load(stem + OFFSETS_SUFFIX)
+    return RaggedTraces(values, offsets)
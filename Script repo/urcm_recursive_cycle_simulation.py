@@ -1,10 +1,12 @@
 import numpy as np
 import pandas as pd
 from qutip import *
+from urcm_reset import extremal_eigenvector
 
 # Parameters
 d = 20  # Hilbert space dimension
 cycles = 3  # Number of cycles
+reset_mode = "lowest"  # eigvecs[0] as before; "dominant" follows the operator comment
 
 # Initial high-entropy state (random mixed state)
 def generate_high_entropy_state(d):
@@ -19,9 +21,10 @@ def compression_operator(rho):
     return (proj * rho * proj.dag()).unit()
 
 # Entropy reset operator: simulate purification to dominant eigenstate
+# Only the reset_mode eigenpair is computed (LAPACK eigh with subset_by_index at d = 20)
 def entropy_reset_operator(rho):
-    eigvals, eigvecs = rho.eigenstates()
-    purified = eigvecs[0] * eigvecs[0].dag()  # dominant eigenvector
+    psi = Qobj(extremal_eigenvector(rho, reset_mode), dims=[rho.dims[0], [1]])
+    purified = psi * psi.dag()
     return purified.unit()
 
 # Bounce operator: simulate with unitary evolution
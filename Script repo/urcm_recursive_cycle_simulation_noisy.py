@@ -1,10 +1,12 @@
 import numpy as np
 import pandas as pd
 from qutip import *
+from urcm_reset import extremal_eigenvector
 
 # Parameters
 d = 20  # Hilbert space dimension
 cycles = 3  # Number of cycles
+reset_mode = "lowest"  # eigvecs[0] as before; "dominant" follows the operator comment
 noise_strength = 0.05  # Strength of depolarizing noise
 
 # Initial high-entropy state (random mixed state)
@@ -20,9 +22,10 @@ def compression_operator(rho):
     return (proj * rho * proj.dag()).unit()
 
 # Entropy reset operator: simulate purification to dominant eigenstate
+# Single-eigenpair LAPACK eigh on the d = 20 state; the noise is applied after the reset
 def entropy_reset_operator(rho):
-    eigvals, eigvecs = rho.eigenstates()
-    purified = eigvecs[0] * eigvecs[0].dag()
+    psi = Qobj(extremal_eigenvector(rho, reset_mode), dims=[rho.dims[0], [1]])
+    purified = psi * psi.dag()
     return purified.unit()
 
 # Bounce operator: simulate with unitary evolution
@@ -0,0 +1,58 @@
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+from scipy.sparse.linalg import ArpackNoConvergence, LinearOperator, eigsh
+from urcm_bounce import as_scipy_operator
+
+# Partial eigensolver for the entropy reset operator S. The reset only needs a
+# single extremal eigenvector, so instead of a full dense rho.eigenstates():
+#   dominant: ARPACK eigsh (k=1, largest algebraic), warm-started from the
+#             previous cycle's vector, which converges in a few iterations;
+#   lowest:   the smallest eigenvalues of a compressed density matrix cluster
+#             at zero, where plain ARPACK stalls. Dense inputs go straight to
+#             LAPACK for that single eigenpair; sparse inputs use shift-invert
+#             eigsh just below zero.
+# The scripts take eigvecs[0] (the lowest eigenvalue) while their comments say
+# "dominant eigenvector"; which="lowest" / "dominant" makes that choice explicit.
+
+DENSE_MAX_DIM = 64  # below this LAPACK beats ARPACK for the dominant vector too
+SHIFT = 1e-8  # shift-invert sigma = -SHIFT * max|rho_ij|, just below a PSD spectrum
+SHIFT_MAXITER = 20  # a degenerate null space can stall shift-invert; then go dense
+
+def _dense(A):
+    if isinstance(A, LinearOperator):
+        return A @ np.eye(A.shape[0])
+    return A.toarray() if hasattr(A, "toarray") else np.asarray(A)
+
+def extremal_eigenvector(rho, which="dominant", v0=None, tol=0):
+    """Eigenvector of the largest ("dominant") or smallest ("lowest") eigenvalue of a Hermitian rho.
+
+    The sparse "lowest" path assumes rho is positive semidefinite, as density matrices are.
+    """
+    if which not in ("dominant", "lowest"):
+        raise ValueError(f"which must be 'dominant' or 'lowest', not {which!r}")
+    A = rho if isinstance(rho, LinearOperator) else as_scipy_operator(rho)
+    d = A.shape[0]
+
+    if d > DENSE_MAX_DIM:
+        try:
+            if which == "dominant":
+                return eigsh(A, k=1, which="LA", v0=v0, tol=tol)[1][:, 0]
+            if scipy.sparse.issparse(A):
+                sigma = -SHIFT * abs(A).max()
+                return eigsh(A, k=1, sigma=sigma, which="LM", v0=v0, tol=tol, maxiter=SHIFT_MAXITER)[1][:, 0]
+        except (ArpackNoConvergence, RuntimeError):
+            pass  # no convergence or a singular shift: fall back to the dense solver
+    index = d - 1 if which == "dominant" else 0
+    return scipy.linalg.eigh(_dense(A), subset_by_index=[index, index])[1][:, 0]
+
+class EntropyReset:
+    def __init__(self, which="dominant"):
+        self.which = which
+        self.v0 = None
+
+    def eigenvector(self, rho):
+        """Extremal eigenvector of rho, warm-started from the previous call's result."""
+        psi = extremal_eigenvector(rho, self.which, v0=self.v0)
+        self.v0 = psi
+        return psi
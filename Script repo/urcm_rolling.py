@@ -0,0 +1,54 @@
+import numpy as np
+
+# Rolling-window statistics in O(n) for the observer and CMB metric scripts.
+# Window sums of (x - a), (x - a)^2 and (x - a)^3 come from differences of
+# cumulative sums, so each statistic costs the same however wide the window.
+# To avoid cancellation when the local spread is small next to the trend (as
+# for slowly drifting metric series), the series is processed in blocks, each
+# re-centred on its own mean a with its cumulative sums restarted.
+# Window k covers x[k:k + window], for k = 0 .. len(x) - window. Windows run
+# along axis 0, so an (n, K) array gives the statistics of K series at once.
+
+ROUNDING = np.finfo(np.float64).eps
+
+def _window_moments(x, window, block=None):
+    # Mean, variance and third central moment of every full window (population form)
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x) - window + 1
+    if window < 1 or n < 1:
+        empty = np.empty((0,) + x.shape[1:])
+        return empty, empty, empty
+    block = block or 4 * window
+    mean, var, m3 = (np.empty((n,) + x.shape[1:]) for _ in range(3))
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        seg = x[start:stop + window - 1]
+        anchor = seg.mean(axis=0)
+        c = seg - anchor
+        sums = []
+        for power in (1, 2, 3):
+            cs = np.concatenate([np.zeros((1,) + c.shape[1:]), np.cumsum(c ** power, axis=0)])
+            sums.append((cs[window:] - cs[:-window]) / window)
+        s1, s2, s3 = sums
+        mean[start:stop] = anchor + s1
+        # The differenced sums carry rounding relative to the block's total sum of
+        # squares; a window variance under that is a constant window, not signal
+        v = s2 - s1 ** 2
+        tol = ROUNDING * len(seg) * np.sum(c ** 2, axis=0) / window
+        var[start:stop] = np.where(v > tol, v, 0.0)
+        m3[start:stop] = s3 - 3 * s1 * s2 + 2 * s1 ** 3
+    return mean, var, m3
+
+def rolling_mean(x, window):
+    return _window_moments(x, window)[0]
+
+def rolling_std(x, window, ddof=0):
+    """np.std of every window (ddof as in np.std)."""
+    var = _window_moments(x, window)[1]
+    return np.sqrt(var * window / (window - ddof))
+
+def rolling_skew(x, window):
+    """scipy.stats.skew (biased) of every window; nan where a window is constant."""
+    mean, var, m3 = _window_moments(x, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(var > 0, m3 / var ** 1.5, np.nan)
@@ -0,0 +1,77 @@
+import numpy as np
+import urcm_bloch
+from urcm_entropy_kernel import von_neumann_entropy
+
+# Vectorised subsystem engine for the 50/500-universe entropy scripts.
+# Every subsystem of every universe lives in one (U, S, 2, 2) tensor; each
+# timestep draws all rotation angles and reset masks in single calls and
+# universes that have bounced are dropped from the active set. With bloch=True
+# the subsystems are (U, S, 3) Bloch vectors from urcm_bloch instead.
+
+RESET_STATE = np.array([[1.0, 0.0], [0.0, 0.0]])
+
+def initial_subsystems(shape):
+    """Maximally mixed qubit for every subsystem, shape (*shape, 2, 2)."""
+    shape = (shape,) if np.isscalar(shape) else tuple(shape)
+    return np.broadcast_to(np.eye(2) / 2, shape + (2, 2)).copy()
+
+def random_rotations(shape, rng=None):
+    """Real 2x2 rotations with uniform angles, shape (*shape, 2, 2)."""
+    rng = np.random if rng is None else rng
+    theta = rng.random(shape) * 2 * np.pi
+    c, s = np.cos(theta), np.sin(theta)
+    return np.stack([np.stack([c, -s], axis=-1), np.stack([s, c], axis=-1)], axis=-2)
+
+def step_subsystems(states, reset_prob, rng=None):
+    """One timestep: reset with probability reset_prob, otherwise rotate."""
+    rng = np.random if rng is None else rng
+    resets = rng.random(states.shape[:-2]) < reset_prob
+    U = random_rotations(states.shape[:-2], rng)
+    states = U @ states @ U.swapaxes(-1, -2).conj()
+    states[resets] = RESET_STATE
+    return states
+
+def step_bloch_subsystems(states, reset_prob, rng=None):
+    """Bloch-vector form of step_subsystems, drawing the same random numbers."""
+    rng = np.random if rng is None else rng
+    resets = rng.random(states.shape[:-1]) < reset_prob
+    states = urcm_bloch.unitary_evolve(states, rng)
+    states[resets] = urcm_bloch.POLE
+    return states
+
+def run_universes(num_universes, num_subsystems=100, reset_prob=0.02, entropy_threshold=1e-3,
+                  max_timesteps=5000, rng=None, bloch=False):
+    """Entropy traces and bounce timesteps (None if no bounce) for every universe."""
+    if bloch:
+        states = urcm_bloch.generate_initial_state((num_universes, num_subsystems))
+        step, entropy = step_bloch_subsystems, urcm_bloch.von_neumann_entropy
+    else:
+        states = initial_subsystems((num_universes, num_subsystems))
+        step, entropy = step_subsystems, von_neumann_entropy
+    traces = np.empty((num_universes, max_timesteps))
+    lengths = np.full(num_universes, max_timesteps)
+    bounce_times = [None] * num_universes
+    active = np.arange(num_universes)
+
+    for t in range(max_timesteps):
+        states = step(states, reset_prob, rng)
+        total_entropy = entropy(states).sum(axis=-1)
+        traces[active, t] = total_entropy
+
+        bounced = total_entropy < entropy_threshold
+        for u in active[bounced]:
+            bounce_times[u] = t
+        lengths[active[bounced]] = t + 1
+        states, active = states[~bounced], active[~bounced]
+        if active.size == 0:
+            break
+
+    entropy_traces = [traces[u, :lengths[u]] for u in range(num_universes)]
+    return entropy_traces, bounce_times
+
+def run_universe(num_subsystems=100, reset_prob=0.02, entropy_threshold=1e-3, max_timesteps=5000,
+                 rng=None, bloch=False):
+    """Single-universe form matching the scripts' run_universe() return value."""
+    traces, bounce_times = run_universes(1, num_subsystems, reset_prob, entropy_threshold, max_timesteps,
+                                         rng, bloch)
+    return list(traces[0]), bounce_times[0]